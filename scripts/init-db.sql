@@ -108,7 +108,7 @@ CREATE TABLE order_metrics (
 
 -- Indexes for performance
 CREATE INDEX idx_customers_email ON customers(email);
-CREATE INDEX idx_customers_created_at ON customers(created_at);
+CREATE INDEX idx_customers_created_at ON customers(created_at DESC, id DESC);  -- keyset pagination of /customers
 
 CREATE INDEX idx_products_sku ON products(sku);
 CREATE INDEX idx_products_name ON products(name);
@@ -140,9 +140,12 @@ CREATE INDEX idx_order_metrics_date ON order_metrics(date);
 -- Índices compostos otimizados para queries frequentes e críticas
 
 -- 1. Índice composto para listagem de orders por customer com ordenação por data
---    Otimiza: SELECT * FROM orders WHERE customer_id = ? ORDER BY created_at DESC
+--    Otimiza: SELECT * FROM orders WHERE customer_id = ? AND (created_at, id) < (?, ?)
+--             ORDER BY created_at DESC, id DESC (paginação por keyset/cursor)
+--    INCLUDE cobre as demais colunas do SELECT, permitindo index-only scan (sem heap fetch)
 CREATE INDEX idx_orders_customer_created_at 
-ON orders(customer_id, created_at DESC);
+ON orders(customer_id, created_at DESC, id DESC)
+INCLUDE (product_id, quantity, total_amount, status, updated_at);
 
 -- 2. Índice parcial para orders pendentes (mais consultadas)
 --    Reduz tamanho do índice e melhora performance para queries filtradas
@@ -172,7 +175,7 @@ ON orders(status, created_at DESC);
 
 -- Comentários explicativos sobre os índices otimizados
 COMMENT ON INDEX idx_orders_customer_created_at IS 
-'Otimiza queries de listagem de orders por customer ordenadas por data - reduz tempo de query de O(n log n) para O(log n)';
+'Otimiza queries de listagem de orders por customer ordenadas por data - reduz tempo de query de O(n log n) para O(log n); covering index para index-only scan';
 
 COMMENT ON INDEX idx_orders_status_pending IS 
 'Otimiza queries que filtram orders pendentes - índice parcial reduz tamanho e melhora performance';
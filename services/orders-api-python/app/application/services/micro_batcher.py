@@ -0,0 +1,92 @@
+# Application Service Layer - Generic Micro-Batching
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Generic, List, Optional, Set, Tuple, TypeVar, Union
+
+from app.core.logging import LoggerMixin
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+# A flush returns one entry per item, in order: the item's result, or the exception to raise for it
+BatchFlush = Callable[[List[ItemT]], Awaitable[List[Union[ResultT, BaseException]]]]
+
+class MicroBatcher(LoggerMixin, Generic[ItemT, ResultT]):
+    """Groups items submitted concurrently into batches handed to a single flush call
+    
+    Each caller enqueues an item and awaits a future. A background task waits up
+    to `flush_interval_ms` for more items to arrive (or until `max_batch_size`
+    are queued), then passes them to `flush`. The flush returns one result per
+    item - an exception instance in a slot is raised to that caller only - and
+    if the flush itself raises, every caller of the batch gets that exception.
+    The background task is started lazily and exits when the queue drains.
+    """
+    
+    def __init__(
+        self,
+        flush: BatchFlush,
+        max_batch_size: int = 100,
+        flush_interval_ms: float = 2.0,
+        operation: str = "micro_batch"
+    ):
+        self.flush = flush
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.operation = operation
+        self._queue: Deque[Tuple[ItemT, asyncio.Future]] = deque()
+        self._batch_full: Optional[asyncio.Event] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+    
+    async def submit(self, item: ItemT) -> ResultT:
+        """Enqueue an item and wait until its batch is flushed"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((item, future))
+        
+        if self._collector is None or self._collector.done():
+            # Bind the event to the running loop together with its collector task
+            self._batch_full = asyncio.Event()
+            self._collector = asyncio.create_task(self._collect())
+        if len(self._queue) >= self.max_batch_size:
+            self._batch_full.set()
+        
+        return await future
+    
+    async def _collect(self) -> None:
+        """Drain the queue in batches until it is empty"""
+        while self._queue:
+            # Give concurrent callers a short window to join the batch
+            if len(self._queue) < self.max_batch_size:
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            self._batch_full.clear()
+            
+            batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.max_batch_size))]
+            
+            # Flush concurrently so a slow batch does not hold back the next one
+            flush = asyncio.create_task(self._flush(batch))
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self, batch: List[Tuple[ItemT, asyncio.Future]]) -> None:
+        """Flush one batch and resolve the callers' futures"""
+        try:
+            results = await self.flush([item for item, _ in batch])
+        except Exception as e:
+            self.log_warning(
+                "Batch flush failed",
+                error=str(e),
+                batch_size=len(batch),
+                operation=self.operation
+            )
+            results = [e] * len(batch)
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,78 @@
+# Application Service Layer - Order Creation Batching
+from typing import List, Optional, Tuple, Union
+
+from app.domain.models.order import Order
+from app.domain.interfaces.repositories import OrderRepositoryInterface
+from app.application.services.micro_batcher import MicroBatcher
+from app.core.logging import LoggerMixin
+
+class OrderCreationBatcher(LoggerMixin):
+    """Groups orders created concurrently into a single database transaction
+    
+    Each caller submits its (already validated) order to a MicroBatcher, which
+    saves every order of a batch with one `create_batch_with_outbox` call, so
+    N orders share one commit/WAL flush.
+    """
+    
+    def __init__(
+        self,
+        order_repository: OrderRepositoryInterface,
+        max_batch_size: int = 100,
+        flush_interval_ms: float = 2.0
+    ):
+        self.order_repository = order_repository
+        self._batcher: MicroBatcher[Tuple[Order, Optional[str], Optional[str]], Optional[Order]] = MicroBatcher(
+            self._save_batch,
+            max_batch_size=max_batch_size,
+            flush_interval_ms=flush_interval_ms,
+            operation="create_order_batch"
+        )
+    
+    async def submit(
+        self,
+        order: Order,
+        trace_id: Optional[str] = None,
+        span_id: Optional[str] = None
+    ) -> Optional[Order]:
+        """Enqueue an order and wait until its batch is saved. Returns None if stock could not be reserved"""
+        return await self._batcher.submit((order, trace_id, span_id))
+    
+    async def _save_batch(
+        self,
+        batch: List[Tuple[Order, Optional[str], Optional[str]]]
+    ) -> List[Union[Optional[Order], Exception]]:
+        """Save one batch in a single transaction"""
+        orders = [order for order, _, _ in batch]
+        trace_contexts = [(trace_id, span_id) for _, trace_id, span_id in batch]
+        
+        try:
+            return await self.order_repository.create_batch_with_outbox(orders, trace_contexts)
+        except Exception as e:
+            # A single bad order (e.g. unknown customer) aborts the whole transaction -
+            # fall back to saving the orders one by one so only that order fails
+            self.log_warning(
+                "Order batch failed, retrying orders individually",
+                error=str(e),
+                batch_size=len(batch),
+                operation="create_order_batch"
+            )
+            return await self._save_individually(batch)
+    
+    async def _save_individually(
+        self,
+        batch: List[Tuple[Order, Optional[str], Optional[str]]]
+    ) -> List[Union[Optional[Order], Exception]]:
+        """Save each order of a failed batch on its own"""
+        results: List[Union[Optional[Order], Exception]] = []
+        for order, trace_id, span_id in batch:
+            try:
+                results.append(await self.order_repository.create_order_atomic(
+                    order,
+                    product_id=order.product_id,
+                    quantity=order.quantity,
+                    trace_id=trace_id,
+                    span_id=span_id
+                ))
+            except Exception as e:
+                results.append(e)
+        return results
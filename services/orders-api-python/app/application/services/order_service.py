@@ -1,5 +1,6 @@
 # Application Service Layer
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 from uuid import UUID
 
 from app.domain.models.order import Order, OrderCreateRequest, OrderResponse
@@ -44,11 +45,11 @@ class OrderService:
     
     async def list_orders_by_customer(
         self,
-        customer_id: str,
+        customer_id: UUID,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
         trace_id: Optional[str] = None,
         span_id: Optional[str] = None
-    ) -> list[OrderResponse]:
-        """List orders by customer"""
-        return await self.list_orders_use_case.execute(customer_id, limit, offset, trace_id, span_id)
+    ) -> Tuple[list[OrderResponse], Optional[Tuple[datetime, UUID]]]:
+        """List orders by customer (keyset pagination)"""
+        return await self.list_orders_use_case.execute(customer_id, limit, cursor, trace_id, span_id)
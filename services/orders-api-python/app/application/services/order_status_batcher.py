@@ -0,0 +1,64 @@
+# Application Service Layer - Order Status Update Batching
+from typing import Dict, List, Tuple, Union
+from uuid import UUID
+
+from app.domain.models.order import OrderStatus
+from app.domain.interfaces.repositories import OrderRepositoryInterface
+from app.application.services.micro_batcher import MicroBatcher
+from app.core.logging import LoggerMixin
+
+class OrderStatusBatcher(LoggerMixin):
+    """Groups concurrent order status updates into one UPDATE per status
+    
+    Each caller submits an (order_id, status) pair to a MicroBatcher; a batch is
+    applied with one `update_status_many` call per target status, so N inventory
+    events cost a round-trip per status instead of one each.
+    """
+    
+    def __init__(
+        self,
+        order_repository: OrderRepositoryInterface,
+        max_batch_size: int = 100,
+        flush_interval_ms: float = 10.0
+    ):
+        self.order_repository = order_repository
+        self._batcher: MicroBatcher[Tuple[UUID, OrderStatus], bool] = MicroBatcher(
+            self._apply_batch,
+            max_batch_size=max_batch_size,
+            flush_interval_ms=flush_interval_ms,
+            operation="update_order_status_batch"
+        )
+    
+    async def submit(self, order_id: UUID, new_status: OrderStatus) -> bool:
+        """Enqueue a status update and wait until its batch is applied. Returns False if the order does not exist"""
+        return await self._batcher.submit((order_id, new_status))
+    
+    async def _apply_batch(self, batch: List[Tuple[UUID, OrderStatus]]) -> List[Union[bool, Exception]]:
+        """Apply one batch (one UPDATE per status)"""
+        by_status: Dict[OrderStatus, List[int]] = {}
+        for index, (_, new_status) in enumerate(batch):
+            by_status.setdefault(new_status, []).append(index)
+        
+        results: List[Union[bool, Exception]] = [False] * len(batch)
+        for new_status, indexes in by_status.items():
+            try:
+                updated = await self.order_repository.update_status_many(
+                    [batch[i][0] for i in indexes],
+                    new_status
+                )
+            except Exception as e:
+                # Fail every caller of this status group so their messages are nacked
+                self.log_warning(
+                    "Order status batch failed",
+                    error=str(e),
+                    batch_size=len(indexes),
+                    status=new_status.value,
+                    operation="update_order_status_batch"
+                )
+                for i in indexes:
+                    results[i] = e
+                continue
+            
+            for i in indexes:
+                results[i] = batch[i][0] in updated
+        return results
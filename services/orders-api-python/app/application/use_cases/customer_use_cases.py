@@ -1,7 +1,7 @@
 # Application Use Cases - Customer
-from typing import Optional, List
-from uuid import UUID
 from datetime import datetime
+from typing import Optional, List, Tuple
+from uuid import UUID
 import logging
 
 from app.domain.models.customer import (
@@ -29,12 +29,7 @@ class CreateCustomerUseCase(LoggerMixin):
         
         try:
             # Validate business rules
-            await self._validate_customer_data(request)
-            
-            # Check if email already exists
-            existing = await self.customer_repository.get_by_email(request.email)
-            if existing:
-                raise DuplicateEmailError(f"Customer with email {request.email} already exists")
+            self._validate_customer_data(request)
             
             # Create domain model
             customer = Customer.create_new(
@@ -44,7 +39,7 @@ class CreateCustomerUseCase(LoggerMixin):
                 address=request.address
             )
             
-            # Save customer
+            # Save customer - the repository raises DuplicateEmailError if the email exists
             saved_customer = await self.customer_repository.create(customer)
             
             # Create response
@@ -65,7 +60,7 @@ class CreateCustomerUseCase(LoggerMixin):
             self.log_error("Failed to create customer", error=str(e), email=request.email)
             raise
     
-    async def _validate_customer_data(self, request: CustomerCreateRequest) -> None:
+    def _validate_customer_data(self, request: CustomerCreateRequest) -> None:
         """Validate customer data against business rules"""
         
         if not request.name or not request.name.strip():
@@ -116,20 +111,33 @@ class ListCustomersUseCase(LoggerMixin):
         """Execute list customers use case"""
         
         try:
-            customers = await self.customer_repository.list_all(limit=limit, offset=offset)
+            rows = await self.customer_repository.list_all_raw(limit=limit, offset=offset)
+            return list(map(CustomerResponse.from_row, rows))
+            
+        except Exception as e:
+            self.log_error("Failed to list customers", error=str(e))
+            raise
+    
+    async def execute_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, UUID]] = None
+    ) -> Tuple[List[CustomerResponse], Optional[Tuple[datetime, UUID]]]:
+        """List one keyset page of customers
+        
+        Returns the page and the (created_at, id) cursor of the next page,
+        or None when this is the last page.
+        """
+        
+        try:
+            rows = await self.customer_repository.list_page_raw(limit=limit, cursor=cursor)
             
-            return [
-                CustomerResponse(
-                    id=c.id,
-                    name=c.name,
-                    email=c.email,
-                    phone=c.phone,
-                    address=c.address,
-                    created_at=c.created_at,
-                    updated_at=c.updated_at
-                )
-                for c in customers
-            ]
+            next_cursor = None
+            if len(rows) == limit:
+                last = rows[-1]
+                next_cursor = (last['created_at'], last['id'])
+            
+            return list(map(CustomerResponse.from_row, rows)), next_cursor
             
         except Exception as e:
             self.log_error("Failed to list customers", error=str(e))
@@ -145,28 +153,20 @@ class UpdateCustomerUseCase(LoggerMixin):
         """Execute customer update use case"""
         
         try:
-            # Get existing customer
-            existing_customer = await self.customer_repository.get_by_id(customer_id)
-            if not existing_customer:
-                raise CustomerNotFoundError(f"Customer with ID {customer_id} not found")
-            
             # Validate business rules
-            await self._validate_customer_update_data(request)
+            self._validate_customer_update_data(request)
             
-            # Check if email already exists (excluding current customer)
-            existing = await self.customer_repository.get_by_email(request.email)
-            if existing and existing.id != customer_id:
-                raise DuplicateEmailError(f"Customer with email {request.email} already exists")
-            
-            # Update domain model
-            existing_customer.name = request.name
-            existing_customer.email = request.email
-            existing_customer.phone = request.phone
-            existing_customer.address = request.address
-            existing_customer.updated_at = datetime.utcnow()
-            
-            # Save updated customer
-            updated_customer = await self.customer_repository.update(existing_customer)
+            # Update in a single round-trip: existence is checked by the UPDATE itself
+            # and email uniqueness by the unique index (raises DuplicateEmailError)
+            updated_customer = await self.customer_repository.update_info(
+                customer_id,
+                name=request.name,
+                email=request.email,
+                phone=request.phone,
+                address=request.address
+            )
+            if not updated_customer:
+                raise CustomerNotFoundError(f"Customer with ID {customer_id} not found")
             
             # Create response
             response = CustomerResponse(
@@ -186,7 +186,7 @@ class UpdateCustomerUseCase(LoggerMixin):
             self.log_error("Failed to update customer", error=str(e), customer_id=str(customer_id))
             raise
     
-    async def _validate_customer_update_data(self, request: CustomerUpdateRequest) -> None:
+    def _validate_customer_update_data(self, request: CustomerUpdateRequest) -> None:
         """Validate customer update data against business rules"""
         
         if not request.name or not request.name.strip():
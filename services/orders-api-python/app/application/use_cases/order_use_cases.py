@@ -1,12 +1,15 @@
 # Application Use Cases (Business Logic)
-from typing import Optional
+from datetime import datetime
+from typing import Optional, Tuple
 from uuid import UUID
 import logging
 
-from app.domain.models.order import Order, OrderCreateRequest, OrderResponse, OrderNotFoundError, InvalidOrderDataError, OutboxEvent
+from app.domain.models.order import Order, OrderCreateRequest, OrderResponse, OrderNotFoundError, InvalidOrderDataError
+from app.domain.models.product import InsufficientStockError
 from app.domain.interfaces.repositories import OrderRepositoryInterface, ProductRepositoryInterface
+from app.application.services.order_batcher import OrderCreationBatcher
 from app.core.logging import LoggerMixin
-from app.core.profiling import profiler
+from app.core.profiling import measure
 
 logger = logging.getLogger(__name__)
 
@@ -16,10 +19,13 @@ class CreateOrderUseCase(LoggerMixin):
     def __init__(
         self,
         order_repository: OrderRepositoryInterface,
-        product_repository: ProductRepositoryInterface
+        product_repository: ProductRepositoryInterface,
+        order_batcher: Optional[OrderCreationBatcher] = None
     ):
         self.order_repository = order_repository
         self.product_repository = product_repository
+        # When set, concurrent orders are saved together in one transaction
+        self.order_batcher = order_batcher
     
     async def execute(
         self,
@@ -30,21 +36,11 @@ class CreateOrderUseCase(LoggerMixin):
         """Execute order creation use case with Transactional Outbox Pattern"""
         
         try:
-            # Validate business rules
-            with profiler.measure("validation"):
-                await self._validate_order_data(request)
-            
-            # Check product exists (stock will be reserved atomically in the transaction)
-            with profiler.measure("product_check"):
-                product = await self.product_repository.get_by_id(request.product_id)
-                if not product:
-                    raise InvalidOrderDataError(f"Product not found: {request.product_id}")
-                
-                # Note: Stock availability is checked and reserved atomically in create_with_outbox_event
-                # This prevents race conditions where stock might be depleted between check and reservation
+            # Business rules (quantity/amount limits, required IDs) are enforced by
+            # OrderCreateRequest's Field constraints while the request body is parsed
             
             # Create domain model
-            with profiler.measure("domain_creation"):
+            with measure("domain_creation"):
                 order = Order.create_new(
                     customer_id=request.customer_id,
                     product_id=request.product_id,
@@ -52,24 +48,30 @@ class CreateOrderUseCase(LoggerMixin):
                     total_amount=request.total_amount
                 )
             
-            # Create outbox event for order.created
-            with profiler.measure("outbox_creation"):
-                outbox_event = OutboxEvent.create_order_created_event(
-                    order,
-                    trace_id=trace_id,
-                    span_id=span_id
-                )
-            
-            # Save order, reserve stock, and outbox event in a single transaction (Transactional Outbox Pattern)
+            # Reserve stock, save order and outbox event in a single statement (Transactional Outbox Pattern)
             # This ensures atomicity: either all are saved, or none is
-            # Stock is reserved in the same transaction to prevent race conditions
-            with profiler.measure("database_transaction"):
-                saved_order = await self.order_repository.create_with_outbox_event(
-                    order, 
-                    outbox_event,
-                    product_id=request.product_id,
-                    quantity=request.quantity
-                )
+            # OPTIMIZATION: The product existence check is folded into the stock reservation,
+            # saving one round-trip and removing the race between check and reservation.
+            # The order.created payload is built in SQL from the inserted row
+            with measure("database_transaction"):
+                if self.order_batcher is not None:
+                    saved_order = await self.order_batcher.submit(order, trace_id=trace_id, span_id=span_id)
+                else:
+                    saved_order = await self.order_repository.create_order_atomic(
+                        order,
+                        product_id=request.product_id,
+                        quantity=request.quantity,
+                        trace_id=trace_id,
+                        span_id=span_id
+                    )
+                if saved_order is None:
+                    # Failure path only: tell a missing product apart from a stock-out
+                    # (existence is cached, so this rarely costs a round-trip)
+                    if not await self.product_repository.exists(request.product_id):
+                        raise InvalidOrderDataError(f"Product not found: {request.product_id}")
+                    raise InsufficientStockError(
+                        f"Insufficient stock for product: {request.product_id}. Requested: {request.quantity}"
+                    )
             
             # OPTIMIZATION: Removed logging from hot path to reduce latency
             # Logging is expensive (json.dumps, string formatting) and adds ~5-15ms per request
@@ -78,18 +80,9 @@ class CreateOrderUseCase(LoggerMixin):
             # Note: Event will be published asynchronously by outbox-dispatcher service
             # which reads from outbox_events table and publishes to RabbitMQ
             
-            # OPTIMIZATION: Direct instantiation instead of from_orm to avoid Pydantic overhead
-            with profiler.measure("response_creation"):
-                response = OrderResponse(
-                    id=saved_order.id,
-                    customer_id=saved_order.customer_id,
-                    product_id=saved_order.product_id,
-                    quantity=saved_order.quantity,
-                    total_amount=saved_order.total_amount,
-                    status=saved_order.status,
-                    created_at=saved_order.created_at,
-                    updated_at=saved_order.updated_at
-                )
+            # OPTIMIZATION: Built without validation - saved_order is already validated
+            with measure("response_creation"):
+                response = OrderResponse.from_domain(saved_order)
             return response
             
         except InvalidOrderDataError as e:
@@ -114,30 +107,6 @@ class CreateOrderUseCase(LoggerMixin):
                 operation="create_order"
             )
             raise
-    
-    async def _validate_order_data(self, request: OrderCreateRequest) -> None:
-        """Validate order data against business rules - Optimized for performance"""
-        
-        # OPTIMIZATION: Fast-path validation - check most common cases first
-        # Use short-circuit evaluation to avoid unnecessary checks
-        
-        # Check quantity limits first (most common validation)
-        if request.quantity <= 0:
-            raise InvalidOrderDataError("Quantity must be greater than 0")
-        if request.quantity > 1000:  # Business rule: max 1000 items per order
-            raise InvalidOrderDataError("Quantity cannot exceed 1000 items")
-
-        # Check amount limits
-        if request.total_amount <= 0:
-            raise InvalidOrderDataError("Total amount must be greater than 0")
-        if request.total_amount > 100000:  # Business rule: max $100,000 per order
-            raise InvalidOrderDataError("Total amount cannot exceed $100,000")
-
-        # Check IDs - UUIDs are validated by Pydantic, just check they're not None
-        if not request.customer_id:
-            raise InvalidOrderDataError("Customer ID is required")
-        if not request.product_id:
-            raise InvalidOrderDataError("Product ID is required")
 
 class GetOrderUseCase(LoggerMixin):
     """Use case for getting an order by ID"""
@@ -166,26 +135,10 @@ class GetOrderUseCase(LoggerMixin):
                 )
                 raise OrderNotFoundError(f"Order with ID {order_id} not found")
             
-            self.log_info(
-                "Order retrieved successfully",
-                order_id=str(order.id),
-                customer_id=str(order.customer_id),
-                status=order.status.value,
-                trace_id=trace_id,
-                span_id=span_id,
-                operation="get_order"
-            )
+            # OPTIMIZATION: No success log on the read path - it serialized a JSON
+            # record on every request. Errors are still logged below
             
-            return OrderResponse(
-                id=order.id,
-                customer_id=order.customer_id,
-                product_id=order.product_id,
-                quantity=order.quantity,
-                total_amount=order.total_amount,
-                status=order.status,
-                created_at=order.created_at,
-                updated_at=order.updated_at
-            )
+            return OrderResponse.from_domain(order)
             
         except OrderNotFoundError:
             raise
@@ -210,43 +163,33 @@ class ListOrdersUseCase(LoggerMixin):
         self,
         customer_id: UUID,
         limit: int = 100,
-        offset: int = 0,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
         trace_id: Optional[str] = None,
-        span_id: Optional[str] = None
-    ) -> list[OrderResponse]:
-        """Execute list orders use case"""
+        span_id: Optional[str] = None,
+        offset: int = 0
+    ) -> Tuple[list[OrderResponse], Optional[Tuple[datetime, UUID]]]:
+        """Execute list orders use case
+        
+        Returns the page of orders and the (created_at, id) cursor of the next page,
+        or None when this is the last page. `offset` is deprecated paging, used only
+        without a cursor; its pages carry no next cursor.
+        """
         
         try:
-            orders = await self.order_repository.list_by_customer(
+            offset_paging = bool(offset) and cursor is None
+            rows = await self.order_repository.list_by_customer_raw(
                 customer_id=customer_id,
                 limit=limit,
-                offset=offset
+                cursor=cursor,
+                offset=offset if offset_paging else 0
             )
             
-            self.log_info(
-                "Orders listed successfully",
-                customer_id=str(customer_id),
-                count=len(orders),
-                limit=limit,
-                offset=offset,
-                trace_id=trace_id,
-                span_id=span_id,
-                operation="list_orders"
-            )
+            next_cursor = None
+            if len(rows) == limit and not offset_paging:
+                last = rows[-1]
+                next_cursor = (last['created_at'], last['id'])
             
-            return [
-                OrderResponse(
-                    id=order.id,
-                    customer_id=order.customer_id,
-                    product_id=order.product_id,
-                    quantity=order.quantity,
-                    total_amount=order.total_amount,
-                    status=order.status,
-                    created_at=order.created_at,
-                    updated_at=order.updated_at
-                )
-                for order in orders
-            ]
+            return list(map(OrderResponse.from_row, rows)), next_cursor
             
         except Exception as e:
             self.log_error(
@@ -275,34 +218,12 @@ class ListAllOrdersUseCase(LoggerMixin):
         """Execute list all orders use case"""
         
         try:
-            orders = await self.order_repository.list_all(
+            rows = await self.order_repository.list_all_raw(
                 limit=limit,
                 offset=offset
             )
             
-            self.log_info(
-                "All orders listed successfully",
-                count=len(orders),
-                limit=limit,
-                offset=offset,
-                trace_id=trace_id,
-                span_id=span_id,
-                operation="list_all_orders"
-            )
-            
-            return [
-                OrderResponse(
-                    id=order.id,
-                    customer_id=order.customer_id,
-                    product_id=order.product_id,
-                    quantity=order.quantity,
-                    total_amount=order.total_amount,
-                    status=order.status,
-                    created_at=order.created_at,
-                    updated_at=order.updated_at
-                )
-                for order in orders
-            ]
+            return list(map(OrderResponse.from_row, rows))
             
         except Exception as e:
             self.log_error(
@@ -1,7 +1,6 @@
 # Application Use Cases - Product
-from typing import Optional, List
+from typing import Optional, List, Sequence, Union
 from uuid import UUID
-from datetime import datetime
 import logging
 
 from app.domain.models.product import (
@@ -17,6 +16,21 @@ from app.core.logging import LoggerMixin
 
 logger = logging.getLogger(__name__)
 
+# Business errors propagate to the API layer untouched (not logged as failures)
+_PASSTHROUGH_ERRORS = (InvalidProductDataError, ProductNotFoundError)
+
+def _validate_product_payload(request: Union[ProductCreateRequest, ProductUpdateRequest]) -> None:
+    """Validate product data against business rules (shared by create and update)"""
+    
+    if not request.name or not request.name.strip():
+        raise InvalidProductDataError("Product name is required")
+    
+    if request.price <= 0:
+        raise InvalidProductDataError("Product price must be greater than 0")
+    
+    if request.stock_quantity < 0:
+        raise InvalidProductDataError("Stock quantity cannot be negative")
+
 class CreateProductUseCase(LoggerMixin):
     """Use case for creating a new product"""
     
@@ -28,13 +42,7 @@ class CreateProductUseCase(LoggerMixin):
         
         try:
             # Validate business rules
-            await self._validate_product_data(request)
-            
-            # Check if SKU already exists
-            if request.sku:
-                existing = await self.product_repository.get_by_sku(request.sku)
-                if existing:
-                    raise InvalidProductDataError(f"Product with SKU {request.sku} already exists")
+            _validate_product_payload(request)
             
             # Create domain model
             product = Product.create_new(
@@ -45,40 +53,19 @@ class CreateProductUseCase(LoggerMixin):
                 stock_quantity=request.stock_quantity
             )
             
-            # Save product
-            saved_product = await self.product_repository.create(product)
-            
-            # Create response
-            response = ProductResponse(
-                id=saved_product.id,
-                name=saved_product.name,
-                description=saved_product.description,
-                price=saved_product.price,
-                sku=saved_product.sku,
-                stock_quantity=saved_product.stock_quantity,
-                created_at=saved_product.created_at,
-                updated_at=saved_product.updated_at
-            )
-            return response
+            # Save product - SKU uniqueness is checked by the INSERT itself (one round-trip)
+            saved_product = await self.product_repository.create_if_sku_unique(product)
+            if saved_product is None:
+                raise InvalidProductDataError(f"Product with SKU {request.sku} already exists")
+            
+            return ProductResponse.from_domain(saved_product)
             
-        except InvalidProductDataError:
+        except _PASSTHROUGH_ERRORS:
             raise
         except Exception as e:
             self.log_error("Failed to create product", error=str(e), name=request.name)
             raise
     
-    async def _validate_product_data(self, request: ProductCreateRequest) -> None:
-        """Validate product data against business rules"""
-        
-        if not request.name or not request.name.strip():
-            raise InvalidProductDataError("Product name is required")
-        
-        if request.price <= 0:
-            raise InvalidProductDataError("Product price must be greater than 0")
-        
-        if request.stock_quantity < 0:
-            raise InvalidProductDataError("Stock quantity cannot be negative")
-
 class GetProductUseCase(LoggerMixin):
     """Use case for getting a product by ID"""
     
@@ -95,23 +82,38 @@ class GetProductUseCase(LoggerMixin):
                 self.log_warning("Product not found", product_id=str(product_id))
                 raise ProductNotFoundError(f"Product with ID {product_id} not found")
             
-            return ProductResponse(
-                id=product.id,
-                name=product.name,
-                description=product.description,
-                price=product.price,
-                sku=product.sku,
-                stock_quantity=product.stock_quantity,
-                created_at=product.created_at,
-                updated_at=product.updated_at
-            )
+            return ProductResponse.from_domain(product)
             
-        except ProductNotFoundError:
+        except _PASSTHROUGH_ERRORS:
             raise
         except Exception as e:
             self.log_error("Failed to get product", error=str(e), product_id=str(product_id))
             raise
 
+class GetProductsByIdsUseCase(LoggerMixin):
+    """Use case for getting several products by ID in a single query"""
+    
+    def __init__(self, product_repository: ProductRepositoryInterface):
+        self.product_repository = product_repository
+    
+    async def execute(self, product_ids: Sequence[UUID]) -> List[ProductResponse]:
+        """Execute get products use case. Unknown IDs are skipped; order follows product_ids"""
+        
+        try:
+            # dict.fromkeys dedups while keeping the requested order
+            unique_ids = list(dict.fromkeys(product_ids))
+            products = await self.product_repository.get_many_by_ids(unique_ids)
+            
+            return [
+                ProductResponse.from_domain(p)
+                for p in (products.get(product_id) for product_id in unique_ids)
+                if p is not None
+            ]
+            
+        except Exception as e:
+            self.log_error("Failed to get products by IDs", error=str(e), count=len(product_ids))
+            raise
+
 class ListProductsUseCase(LoggerMixin):
     """Use case for listing all products"""
     
@@ -124,19 +126,17 @@ class ListProductsUseCase(LoggerMixin):
         try:
             products = await self.product_repository.list_all(limit=limit, offset=offset)
             
-            return [
-                ProductResponse(
-                    id=p.id,
-                    name=p.name,
-                    description=p.description,
-                    price=p.price,
-                    sku=p.sku,
-                    stock_quantity=p.stock_quantity,
-                    created_at=p.created_at,
-                    updated_at=p.updated_at
-                )
-                for p in products
-            ]
+            return [ProductResponse.from_domain(p) for p in products]
+            
+        except Exception as e:
+            self.log_error("Failed to list products", error=str(e))
+            raise
+    
+    async def execute_json(self, limit: int = 100, offset: int = 0) -> str:
+        """Execute list products use case, returning the page as a JSON array"""
+        
+        try:
+            return await self.product_repository.list_all_json(limit=limit, offset=offset)
             
         except Exception as e:
             self.log_error("Failed to list products", error=str(e))
@@ -158,12 +158,13 @@ class UpdateProductUseCase(LoggerMixin):
                 raise ProductNotFoundError(f"Product with ID {product_id} not found")
             
             # Validate business rules
-            await self._validate_product_update_data(request, product_id)
+            _validate_product_payload(request)
             
-            # Check if SKU already exists (excluding current product)
-            if request.sku:
-                existing = await self.product_repository.get_by_sku(request.sku)
-                if existing and existing.id != product_id:
+            # Check if SKU already exists (excluding current product) - only when the
+            # SKU actually changes, so most updates skip the extra round-trip
+            if request.sku and request.sku != existing_product.sku:
+                sku_owner = await self.product_repository.get_by_sku(request.sku)
+                if sku_owner and sku_owner.id != product_id:
                     raise InvalidProductDataError(f"Product with SKU {request.sku} already exists")
             
             # Update domain model
@@ -172,39 +173,15 @@ class UpdateProductUseCase(LoggerMixin):
             existing_product.price = request.price
             existing_product.sku = request.sku
             existing_product.stock_quantity = request.stock_quantity
-            existing_product.updated_at = datetime.utcnow()
             
             # Save updated product
             updated_product = await self.product_repository.update(existing_product)
             
-            # Create response
-            response = ProductResponse(
-                id=updated_product.id,
-                name=updated_product.name,
-                description=updated_product.description,
-                price=updated_product.price,
-                sku=updated_product.sku,
-                stock_quantity=updated_product.stock_quantity,
-                created_at=updated_product.created_at,
-                updated_at=updated_product.updated_at
-            )
-            return response
+            return ProductResponse.from_domain(updated_product)
             
-        except (ProductNotFoundError, InvalidProductDataError):
+        except _PASSTHROUGH_ERRORS:
             raise
         except Exception as e:
             self.log_error("Failed to update product", error=str(e), product_id=str(product_id))
             raise
     
-    async def _validate_product_update_data(self, request: ProductUpdateRequest, product_id: UUID) -> None:
-        """Validate product update data against business rules"""
-        
-        if not request.name or not request.name.strip():
-            raise InvalidProductDataError("Product name is required")
-        
-        if request.price <= 0:
-            raise InvalidProductDataError("Product price must be greater than 0")
-        
-        if request.stock_quantity < 0:
-            raise InvalidProductDataError("Stock quantity cannot be negative")
-
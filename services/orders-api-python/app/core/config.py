@@ -1,5 +1,7 @@
 # Core Configuration and Settings
-from pydantic_settings import BaseSettings
+from functools import cached_property
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 class Settings(BaseSettings):
@@ -28,6 +30,8 @@ class Settings(BaseSettings):
     rabbitmq_user: str = "order_user"
     rabbitmq_password: str = "order_password"
     rabbitmq_vhost: str = "/"
+    # Unacked deliveries per consumer channel - also caps concurrent message handlers
+    rabbitmq_prefetch: int = Field(100, ge=1, le=500)
     
     # OpenTelemetry
     otel_exporter_endpoint: str = "http://localhost:4317"
@@ -36,31 +40,54 @@ class Settings(BaseSettings):
     # Performance
     min_connections: int = 20
     max_connections: int = 90
+    # Separate pool for single-statement reads; 0 shares the main pool
+    read_min_connections: int = 5
+    read_max_connections: int = 0
+    max_queries_per_connection: int = 50000
+    max_inactive_connection_lifetime: int = 300
+    statement_cache_size: int = 256
+    statement_timeout_ms: int = 5000
+    # None keeps the server default (auto), which reuses the generic plans of the warmed statements
+    plan_cache_mode: Optional[str] = None
     connection_timeout: int = 5
     request_timeout: int = 20
     retry_attempts: int = 1
     retry_delay: int = 500
     
-    @property
+    # Order creation batching (groups concurrent POST /orders into one transaction)
+    order_batching_enabled: bool = False
+    order_batch_max_size: int = 100
+    order_batch_flush_interval_ms: float = 2.0
+    
+    # Inventory event status updates batching (one UPDATE per status for concurrent events)
+    order_status_batching_enabled: bool = True
+    order_status_batch_max_size: int = 100
+    order_status_batch_flush_interval_ms: float = 10.0
+    
+    # In-process caches
+    product_cache_ttl_seconds: float = 60.0
+    product_cache_max_size: int = 10000
+    order_cache_ttl_seconds: float = 2.0
+    order_cache_max_size: int = 10000
+    
+    @cached_property
     def database_url(self) -> str:
         """Get database URL"""
         return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
     
-    @property
+    @cached_property
     def redis_url(self) -> str:
         """Get Redis URL"""
         if self.redis_password:
             return f"redis://:{self.redis_password}@{self.redis_host}:{self.redis_port}"
         return f"redis://{self.redis_host}:{self.redis_port}"
     
-    @property
+    @cached_property
     def rabbitmq_url(self) -> str:
         """Get RabbitMQ URL"""
         return f"amqp://{self.rabbitmq_user}:{self.rabbitmq_password}@{self.rabbitmq_host}:{self.rabbitmq_port}{self.rabbitmq_vhost}"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 # Global settings instance
 settings = Settings()
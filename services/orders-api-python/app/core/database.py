@@ -1,46 +1,149 @@
 # Database Configuration and Connection Management
 import asyncpg
 import asyncio
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from contextlib import asynccontextmanager
 import logging
+import orjson
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# jsonb binary wire format: a version byte (1) followed by the JSON text
+_JSONB_VERSION = b'\x01'
+
+def _encode_jsonb(value) -> bytes:
+    return _JSONB_VERSION + orjson.dumps(value)
+
+def _decode_jsonb(data: bytes):
+    return orjson.loads(data[1:])
+
+# Connectivity probe, warmed on every pooled connection like the repository reads
+_PING_SQL = "SELECT 1"
+
 class DatabaseManager:
     """Database connection manager"""
     
     def __init__(self):
         self._pool: Optional[asyncpg.Pool] = None
+        # Optional separate pool for single-statement reads (settings.read_max_connections > 0)
+        self._read_pool: Optional[asyncpg.Pool] = None
+        # Hot statements executed once on every new pooled connection: (query, args, write)
+        self._warmup_statements: List[Tuple[str, tuple, bool]] = [(_PING_SQL, (), False)]
+    
+    def register_warmup(self, query: str, *args, write: bool = False) -> None:
+        """Register a side-effect-free statement to prepare on every new pooled connection
+        
+        asyncpg prepares statements per connection and caches them by SQL text, so
+        running the statement once at connection init (with harmless arguments)
+        leaves it parsed and planned before the first request uses that connection.
+        Write statements (write=True, arguments that change no rows) are only warmed
+        on the main pool - the read pool never executes them.
+        """
+        self._warmup_statements.append((query, args, write))
+    
+    async def _init_read_connection(self, conn: asyncpg.Connection) -> None:
+        """Read pool init hook: same as _init_connection, without the write warm-ups"""
+        await self._init_connection(conn, include_writes=False)
+    
+    async def _init_connection(self, conn: asyncpg.Connection, include_writes: bool = True) -> None:
+        """Pool init hook: register codecs and warm the statement cache of a new connection"""
+        # OPTIMIZATION: numeric columns (prices, order totals) are decoded straight to
+        # float - every caller converted the Decimal to float anyway
+        await conn.set_type_codec(
+            'numeric',
+            encoder=str,
+            decoder=float,
+            schema='pg_catalog',
+            format='text'
+        )
+        # jsonb parameters take Python objects serialized by orjson straight to bytes
+        # (no str round-trip), and jsonb columns come back already parsed
+        await conn.set_type_codec(
+            'jsonb',
+            encoder=_encode_jsonb,
+            decoder=_decode_jsonb,
+            schema='pg_catalog',
+            format='binary'
+        )
+        
+        for query, args, write in self._warmup_statements:
+            if write and not include_writes:
+                continue
+            try:
+                await conn.fetch(query, *args)
+            except Exception as e:
+                # Warm-up is best effort - the statement is prepared on first use anyway
+                logger.warning(f"Statement warm-up failed: {e}")
     
     async def create_pool(self) -> asyncpg.Pool:
-        """Create database connection pool"""
+        """Create database connection pool (and the read pool, when configured)"""
         if self._pool is None:
-            # Otimizações de performance:
-            # - min_size maior para reduzir latência de criação de conexões
-            # - max_size baseado em configuração (padrão 100)
-            # - command_timeout reduzido para queries rápidas (5s)
-            # - JIT desabilitado para melhor performance
-            # - Statement cache habilitado para queries repetidas
-            self._pool = await asyncpg.create_pool(
-                settings.database_url,
-                min_size=settings.min_connections,
-                max_size=settings.max_connections,
-                command_timeout=10,  # 10s timeout para transações - balanceado entre evitar esperas longas e permitir transações legítimas
-                max_queries=10000,  # Cache de queries preparadas
-                max_inactive_connection_lifetime=300,  # 5 minutos
-                timeout=30,  # 30s timeout para criar pool - necessário para múltiplos workers criando conexões simultaneamente
-            )
+            self._pool = await self._create_pool(settings.min_connections, settings.max_connections)
             logger.info(
                 f"Database connection pool created: min={settings.min_connections}, "
                 f"max={settings.max_connections}, command_timeout=10s"
             )
+            if settings.read_max_connections > 0:
+                # Reads get their own connections, so a burst of writes or a long batch
+                # transaction never makes a get_by_id / list_* wait for a connection
+                self._read_pool = await self._create_pool(
+                    settings.read_min_connections,
+                    settings.read_max_connections,
+                    init=self._init_read_connection
+                )
+                logger.info(
+                    f"Database read pool created: min={settings.read_min_connections}, "
+                    f"max={settings.read_max_connections}"
+                )
         return self._pool
     
+    @staticmethod
+    def _server_settings() -> Dict[str, str]:
+        """Session settings sent in the connection startup packet"""
+        server_settings = {
+            'jit': 'off',  # JIT só atrasa queries OLTP curtas
+            # Aborta no servidor queries presas (o command_timeout só cancela do lado do cliente)
+            'statement_timeout': str(settings.statement_timeout_ms),
+            'application_name': settings.otel_service_name,  # Identifica a conexão em pg_stat_activity
+        }
+        # Opt-in: o padrão do servidor (auto) reaproveita o plano genérico dos statements
+        # aquecidos; force_custom_plan re-planejaria cada execução
+        if settings.plan_cache_mode:
+            server_settings['plan_cache_mode'] = settings.plan_cache_mode
+        return server_settings
+    
+    async def _create_pool(self, min_size: int, max_size: int, init=None) -> asyncpg.Pool:
+        """Create an asyncpg pool with the shared connection settings"""
+        # Otimizações de performance:
+        # - min_size maior para reduzir latência de criação de conexões
+        # - max_size baseado em configuração (padrão 100)
+        # - command_timeout reduzido para queries rápidas (5s)
+        # - JIT desabilitado e statement_timeout (e plan_cache_mode, se configurado) enviados
+        #   no startup (server_settings), sem SETs extras por conexão
+        # - Statement cache habilitado para queries repetidas (preparadas uma vez por conexão,
+        #   aquecidas no init). PreparedStatement de conn.prepare() não sobrevive ao release
+        #   da conexão para o pool, por isso o cache do asyncpg é o mecanismo usado
+        return await asyncpg.create_pool(
+            settings.database_url,
+            min_size=min_size,
+            max_size=max_size,
+            command_timeout=10,  # 10s timeout para transações - balanceado entre evitar esperas longas e permitir transações legítimas
+            max_queries=settings.max_queries_per_connection,  # Reciclar conexão após N queries (mantém statement cache quente)
+            max_inactive_connection_lifetime=settings.max_inactive_connection_lifetime,  # 5 minutos
+            statement_cache_size=settings.statement_cache_size,  # Cobre todas as queries dos repositórios
+            max_cached_statement_lifetime=0,  # Statements não expiram (o padrão re-prepara a cada 300s)
+            server_settings=self._server_settings(),
+            init=init or self._init_connection,
+            timeout=30,  # 30s timeout para criar pool - necessário para múltiplos workers criando conexões simultaneamente
+        )
+    
     async def close_pool(self):
         """Close database connection pool"""
+        if self._read_pool:
+            await self._read_pool.close()
+            self._read_pool = None
         if self._pool:
             await self._pool.close()
             self._pool = None
@@ -55,7 +158,7 @@ class DatabaseManager:
         # Tentar adquirir conexão com timeout apropriado
         # Se houver TooManyConnectionsError, aguardar um pouco e retentar
         max_retries = 3
-        retry_delay = 0.1  # 100ms
+        retry_delay = 0.01  # 10ms - Postgres fica na mesma rede; 100ms travava requisições concorrentes
         
         for attempt in range(max_retries):
             try:
@@ -76,20 +179,54 @@ class DatabaseManager:
                     )
                     raise
     
+    # OPTIMIZATION: Single statements go straight to the pool (asyncpg acquires and
+    # releases internally), skipping get_connection's retry/backoff scaffolding.
+    # Use get_connection when a connection must be held (transactions, several statements)
     async def execute_query(self, query: str, *args):
         """Execute a query"""
-        async with self.get_connection() as conn:
-            return await conn.fetch(query, *args)
+        pool = self._pool or await self.create_pool()
+        return await pool.fetch(query, *args)
     
     async def execute_one(self, query: str, *args):
         """Execute a query and return one result"""
-        async with self.get_connection() as conn:
-            return await conn.fetchrow(query, *args)
+        pool = self._pool or await self.create_pool()
+        return await pool.fetchrow(query, *args)
+    
+    async def execute_scalar(self, query: str, *args):
+        """Execute a query and return the first column of the first row"""
+        pool = self._pool or await self.create_pool()
+        return await pool.fetchval(query, *args)
     
     async def execute_command(self, query: str, *args):
         """Execute a command (INSERT, UPDATE, DELETE)"""
-        async with self.get_connection() as conn:
-            return await conn.execute(query, *args)
+        pool = self._pool or await self.create_pool()
+        return await pool.execute(query, *args)
+    
+    async def ping(self) -> None:
+        """Round-trip a prepared SELECT 1 on a pooled connection (raises if the database is unreachable)"""
+        pool = self._pool or await self.create_pool()
+        await pool.fetchval(_PING_SQL)
+    
+    # Read-only statements: served by the read pool when one is configured
+    async def _get_read_pool(self) -> asyncpg.Pool:
+        if self._pool is None:
+            await self.create_pool()
+        return self._read_pool or self._pool
+    
+    async def read_query(self, query: str, *args):
+        """Execute a read-only query"""
+        pool = await self._get_read_pool()
+        return await pool.fetch(query, *args)
+    
+    async def read_one(self, query: str, *args):
+        """Execute a read-only query and return one result"""
+        pool = await self._get_read_pool()
+        return await pool.fetchrow(query, *args)
+    
+    async def read_scalar(self, query: str, *args):
+        """Execute a read-only query and return the first column of the first row"""
+        pool = await self._get_read_pool()
+        return await pool.fetchval(query, *args)
 
 # Global database manager
 db_manager = DatabaseManager()
@@ -1,39 +1,52 @@
 # Logging Configuration
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Dict, Any
-import json
-from datetime import datetime
+from typing import Dict, Any, Optional
+from datetime import datetime, timezone
 import traceback
+import orjson
 
 from app.core.config import settings
 
+# Attributes every LogRecord has; anything else on a record came from `extra=`.
+# color_message is uvicorn's ANSI-colored duplicate of the message
+_STD_LOGRECORD_KEYS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message", "asctime", "color_message"
+}
+
+# Fields StructuredFormatter writes itself; extras with these names are renamed to
+# extra_<name> so they can neither overwrite them nor duplicate the "service" prefix key
+_RESERVED_LOG_KEYS = frozenset({
+    "service", "timestamp", "level", "message", "module", "function", "line", "exception"
+})
+
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logs"""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # OPTIMIZATION: Constant fields are serialized once; each record only
+        # serializes its variable part (with orjson) and is spliced after this prefix
+        self._prefix = b'{"service":' + orjson.dumps(settings.otel_service_name) + b','
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON"""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat()[:-6] + "Z",
             "level": record.levelname,
-            "service": settings.otel_service_name,
             "message": record.getMessage(),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
         }
         
-        # Add extra fields if present
-        if hasattr(record, 'trace_id'):
-            log_data["trace_id"] = record.trace_id
-        if hasattr(record, 'span_id'):
-            log_data["span_id"] = record.span_id
-        if hasattr(record, 'order_id'):
-            log_data["order_id"] = record.order_id
-        if hasattr(record, 'customer_id'):
-            log_data["customer_id"] = record.customer_id
-        if hasattr(record, 'operation'):
-            log_data["operation"] = record.operation
+        # Add extra fields if present (one pass over the record instead of hasattr probes)
+        record_dict = record.__dict__
+        for key in record_dict.keys() - _STD_LOGRECORD_KEYS:
+            log_data["extra_" + key if key in _RESERVED_LOG_KEYS else key] = record_dict[key]
         
         # Add exception info if present
         if record.exc_info:
@@ -43,10 +56,27 @@ class StructuredFormatter(logging.Formatter):
                 "traceback": traceback.format_exception(*record.exc_info)
             }
         
-        return json.dumps(log_data, ensure_ascii=False)
+        # default=str keeps non-JSON extras (e.g. Decimal) loggable
+        body = orjson.dumps(log_data, default=str)
+        return (self._prefix + body[1:]).decode('utf-8')
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that hands the record to the listener as-is
+    
+    The default prepare() formats the message and drops exc_info in the calling
+    thread. The listener lives in this process, so the record can be passed
+    through untouched and StructuredFormatter runs off the request path.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# Background thread writing queued records to stdout (see setup_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
 def setup_logging():
     """Setup application logging"""
+    global _queue_listener
     
     # Create logger
     logger = logging.getLogger()
@@ -55,6 +85,8 @@ def setup_logging():
     # Remove existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    if _queue_listener is not None:
+        _queue_listener.stop()
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -64,8 +96,14 @@ def setup_logging():
     formatter = StructuredFormatter()
     console_handler.setFormatter(formatter)
     
+    # OPTIMIZATION: Request code only enqueues records; formatting and the
+    # blocking stdout write happen on the listener thread
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _queue_listener.start()
+    
     # Add handler to logger
-    logger.addHandler(console_handler)
+    logger.addHandler(_InProcessQueueHandler(log_queue))
     
     # Set specific loggers
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -74,30 +112,45 @@ def setup_logging():
     logging.getLogger("aioredis").setLevel(logging.WARNING)
     logging.getLogger("aio_pika").setLevel(logging.WARNING)
 
+def _stop_queue_listener() -> None:
+    """Flush queued records on interpreter exit"""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+atexit.register(_stop_queue_listener)
+
 class LoggerMixin:
     """Mixin class for adding logging capabilities"""
     
+    _logger: logging.Logger = logging.getLogger("LoggerMixin")
+    
+    def __init_subclass__(cls, **kwargs):
+        """Resolve the class logger once instead of on every log call"""
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(cls.__name__)
+    
     @property
     def logger(self) -> logging.Logger:
         """Get logger for this class"""
-        return logging.getLogger(self.__class__.__name__)
+        return self._logger
     
+    # kwargs is already a fresh dict, so it is passed as `extra` without copying
     def log_info(self, message: str, **kwargs):
         """Log info message with extra fields"""
-        extra = {k: v for k, v in kwargs.items()}
-        self.logger.info(message, extra=extra)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(message, extra=kwargs)
     
     def log_error(self, message: str, **kwargs):
         """Log error message with extra fields"""
-        extra = {k: v for k, v in kwargs.items()}
-        self.logger.error(message, extra=extra)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(message, extra=kwargs)
     
     def log_warning(self, message: str, **kwargs):
         """Log warning message with extra fields"""
-        extra = {k: v for k, v in kwargs.items()}
-        self.logger.warning(message, extra=extra)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(message, extra=kwargs)
     
     def log_debug(self, message: str, **kwargs):
         """Log debug message with extra fields"""
-        extra = {k: v for k, v in kwargs.items()}
-        self.logger.debug(message, extra=extra)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(message, extra=kwargs)
@@ -4,22 +4,38 @@ Pode ser habilitado via variável de ambiente ENABLE_PROFILING=true
 """
 
 import time
+import math
 import os
-from typing import Dict, List, Optional
-from contextlib import contextmanager
-from collections import defaultdict
+from typing import Deque, Dict, Optional
+from contextlib import contextmanager, nullcontext
+from collections import OrderedDict, defaultdict, deque
 import json
 
 ENABLE_PROFILING = os.getenv("ENABLE_PROFILING", "false").lower() == "true"
 
+# Limites de memória: amostras mais antigas são descartadas (ring buffer)
+PROFILING_MAX_SAMPLES = int(os.getenv("PROFILING_MAX_SAMPLES", "10000"))
+PROFILING_MAX_REQUESTS = int(os.getenv("PROFILING_MAX_REQUESTS", "50000"))
+
+# Contexto reutilizável (nullcontext não guarda estado e pode ser reentrado)
+_NULL_CONTEXT = nullcontext()
+
+def _measure_disabled(operation: str) -> nullcontext:
+    """Versão no-op de measure: não cria gerador nem frame por chamada"""
+    return _NULL_CONTEXT
+
 class Profiler:
     """Profiler para medir tempos de execução"""
     
     def __init__(self):
         self.enabled = ENABLE_PROFILING
-        self.timings: Dict[str, List[float]] = defaultdict(list)
+        self.timings: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=PROFILING_MAX_SAMPLES))
         self.current_request_id: Optional[str] = None
-        self.request_timings: Dict[str, Dict[str, float]] = {}
+        self.request_timings: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        if not self.enabled:
+            # Desabilitado: o atributo de instância sobrepõe o método, então
+            # profiler.measure(...) custa uma chamada simples, sem gerador
+            self.measure = _measure_disabled
     
     def reset(self):
         """Reseta os timings"""
@@ -29,10 +45,6 @@ class Profiler:
     @contextmanager
     def measure(self, operation: str):
         """Context manager para medir tempo de uma operação"""
-        if not self.enabled:
-            yield
-            return
-        
         start = time.perf_counter()
         try:
             yield
@@ -50,6 +62,8 @@ class Profiler:
         if self.enabled:
             self.current_request_id = request_id
             self.request_timings[request_id] = {}
+            if len(self.request_timings) > PROFILING_MAX_REQUESTS:
+                self.request_timings.popitem(last=False)
     
     def end_request(self, request_id: str):
         """Finaliza medição de uma requisição"""
@@ -61,15 +75,19 @@ class Profiler:
         stats = {}
         for operation, values in self.timings.items():
             if values:
+                # Uma única ordenação serve min/max e todos os percentis
+                svals = sorted(values)
+                n = len(svals)
+                total = math.fsum(svals)
                 stats[operation] = {
-                    'count': len(values),
-                    'total': sum(values),
-                    'avg': sum(values) / len(values),
-                    'min': min(values),
-                    'max': max(values),
-                    'p50': sorted(values)[int(len(values) * 0.50)],
-                    'p95': sorted(values)[int(len(values) * 0.95)],
-                    'p99': sorted(values)[int(len(values) * 0.99)] if len(values) > 1 else values[0],
+                    'count': n,
+                    'total': total,
+                    'avg': total / n,
+                    'min': svals[0],
+                    'max': svals[-1],
+                    'p50': svals[int(n * 0.50)],
+                    'p95': svals[int(n * 0.95)],
+                    'p99': svals[int(n * 0.99)],
                 }
         return stats
     
@@ -88,3 +106,6 @@ class Profiler:
 # Global profiler instance
 profiler = Profiler()
 
+# Atalho para hot paths: evita o lookup de atributo em profiler.measure
+measure = profiler.measure
+
@@ -1,6 +1,7 @@
 # Domain Repository Interfaces
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 from uuid import UUID
 
 from app.domain.models.order import Order, OrderStatus, OutboxEvent
@@ -30,14 +31,31 @@ class OrderRepositoryInterface(ABC):
         """Update order status only"""
         pass
     
+    @abstractmethod
+    async def update_status_many(self, order_ids: List[UUID], new_status: OrderStatus) -> Set[UUID]:
+        """Set the same status on several orders, returning the ids that were updated"""
+        pass
+    
     @abstractmethod
     async def delete(self, order_id: UUID) -> bool:
         """Delete an order"""
         pass
     
     @abstractmethod
-    async def list_by_customer(self, customer_id: UUID, limit: int = 100, offset: int = 0) -> List[Order]:
-        """List orders by customer ID"""
+    async def list_by_customer(self, customer_id: UUID, limit: int = 100, cursor: Optional[Tuple[datetime, UUID]] = None) -> List[Order]:
+        """List orders by customer ID, newest first, starting after the (created_at, id) cursor"""
+        pass
+    
+    @abstractmethod
+    async def list_by_customer_raw(
+        self,
+        customer_id: UUID,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        offset: int = 0
+    ) -> List[Mapping[str, Any]]:
+        """Same as list_by_customer, returning the database rows without building Order models
+        (`offset` is deprecated and only used without a cursor)"""
         pass
     
     @abstractmethod
@@ -46,8 +64,29 @@ class OrderRepositoryInterface(ABC):
         pass
     
     @abstractmethod
-    async def create_with_outbox_event(self, order: Order, outbox_event: OutboxEvent, product_id: UUID = None, quantity: int = None) -> Order:
-        """Create order, reserve stock (if product_id and quantity provided), and outbox event in a single transaction"""
+    async def list_all_raw(self, limit: int = 100, offset: int = 0) -> List[Mapping[str, Any]]:
+        """Same as list_all, returning the database rows without building Order models"""
+        pass
+    
+    @abstractmethod
+    async def create_order_atomic(
+        self,
+        order: Order,
+        product_id: UUID,
+        quantity: int,
+        trace_id: Optional[str] = None,
+        span_id: Optional[str] = None
+    ) -> Optional[Order]:
+        """Reserve stock, create order and its order.created outbox event in a single statement. Returns None if product is missing or stock is insufficient."""
+        pass
+    
+    @abstractmethod
+    async def create_batch_with_outbox(
+        self,
+        orders: List[Order],
+        trace_contexts: List[Tuple[Optional[str], Optional[str]]]
+    ) -> List[Optional[Order]]:
+        """Atomically create a batch of orders and their outbox events in one transaction. Returns None for orders whose stock reservation failed."""
         pass
 
 class OutboxEventRepositoryInterface(ABC):
@@ -77,7 +116,7 @@ class OutboxEventRepositoryInterface(ABC):
     async def increment_retry(self, event_id: UUID) -> bool:
         """Increment retry count for event"""
         pass
-
+    
 class EventPublisherInterface(ABC):
     """Interface for Event Publisher"""
     
@@ -104,6 +143,21 @@ class ProductRepositoryInterface(ABC):
         """Get product by ID"""
         pass
     
+    @abstractmethod
+    async def create_if_sku_unique(self, product: Product) -> Optional[Product]:
+        """Create a new product unless its SKU is already taken. Returns None on SKU conflict"""
+        pass
+    
+    @abstractmethod
+    async def exists(self, product_id: UUID) -> bool:
+        """Check whether a product exists"""
+        pass
+    
+    @abstractmethod
+    async def get_many_by_ids(self, ids: Sequence[UUID]) -> Dict[UUID, Product]:
+        """Get several products in one query, keyed by ID (missing IDs are absent)"""
+        pass
+    
     @abstractmethod
     async def get_by_sku(self, sku: str) -> Optional[Product]:
         """Get product by SKU"""
@@ -124,6 +178,11 @@ class ProductRepositoryInterface(ABC):
         """List all products"""
         pass
     
+    @abstractmethod
+    async def list_all_json(self, limit: int = 100, offset: int = 0) -> str:
+        """List all products as a pre-serialized JSON array"""
+        pass
+    
     @abstractmethod
     async def update_stock(self, product_id: UUID, quantity: int) -> bool:
         """Update product stock quantity (add or subtract)"""
@@ -139,7 +198,7 @@ class CustomerRepositoryInterface(ABC):
     
     @abstractmethod
     async def create(self, customer: Customer) -> Customer:
-        """Create a new customer"""
+        """Create a new customer. Raises DuplicateEmailError if the email is already in use"""
         pass
     
     @abstractmethod
@@ -157,6 +216,18 @@ class CustomerRepositoryInterface(ABC):
         """Update an existing customer"""
         pass
     
+    @abstractmethod
+    async def update_info(
+        self,
+        customer_id: UUID,
+        name: str,
+        email: str,
+        phone: Optional[str],
+        address: Optional[str]
+    ) -> Optional[Customer]:
+        """Update customer information in a single statement. Returns None if the customer does not exist, raises DuplicateEmailError if the email is taken."""
+        pass
+    
     @abstractmethod
     async def delete(self, customer_id: UUID) -> bool:
         """Delete a customer"""
@@ -166,3 +237,13 @@ class CustomerRepositoryInterface(ABC):
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[Customer]:
         """List all customers"""
         pass
+    
+    @abstractmethod
+    async def list_all_raw(self, limit: int = 100, offset: int = 0) -> List[Mapping[str, Any]]:
+        """Same as list_all, returning the database rows without building Customer models"""
+        pass
+    
+    @abstractmethod
+    async def list_page_raw(self, limit: int = 100, cursor: Optional[Tuple[datetime, UUID]] = None) -> List[Mapping[str, Any]]:
+        """List customers newest first, starting after the (created_at, id) cursor, as database rows"""
+        pass
@@ -1,42 +1,51 @@
 # Domain Models - Customer
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Annotated, Optional, Dict, Any, Mapping
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, validator, EmailStr
+from pydantic import BaseModel, BeforeValidator, Field, ConfigDict, EmailStr, StringConstraints
+
+# Phone numbers are trimmed and length-checked inside pydantic-core
+PhoneStr = Annotated[str, StringConstraints(strip_whitespace=True, max_length=50)]
+
+def _reject_email_without_at(v: Any) -> Any:
+    """Reject obviously invalid emails before the full EmailStr validation runs"""
+    if isinstance(v, str) and '@' not in v:
+        raise ValueError('value is not a valid email address: missing @-sign')
+    return v
+
+FastEmailStr = Annotated[EmailStr, BeforeValidator(_reject_email_without_at)]
 
 class CustomerCreateRequest(BaseModel):
     """Request model for creating a customer"""
     name: str = Field(..., min_length=1, max_length=255, description="Customer name")
-    email: EmailStr = Field(..., description="Customer email")
-    phone: Optional[str] = Field(None, max_length=50, description="Customer phone")
+    email: FastEmailStr = Field(..., description="Customer email")
+    phone: Optional[PhoneStr] = Field(None, description="Customer phone")
     address: Optional[str] = Field(None, description="Customer address")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "John Doe",
-                "email": "john.doe@example.com",
-                "phone": "+1234567890",
-                "address": "123 Main St, City, Country"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "name": "John Doe",
+            "email": "john.doe@example.com",
+            "phone": "+1234567890",
+            "address": "123 Main St, City, Country"
         }
+    })
 
 class CustomerUpdateRequest(BaseModel):
     """Request model for updating a customer"""
     name: str = Field(..., min_length=1, max_length=255, description="Customer name")
-    email: EmailStr = Field(..., description="Customer email")
-    phone: Optional[str] = Field(None, max_length=50, description="Customer phone")
+    email: FastEmailStr = Field(..., description="Customer email")
+    phone: Optional[PhoneStr] = Field(None, description="Customer phone")
     address: Optional[str] = Field(None, description="Customer address")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "John Doe",
-                "email": "john.doe@example.com",
-                "phone": "+1234567890",
-                "address": "123 Main St, City, Country"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "name": "John Doe",
+            "email": "john.doe@example.com",
+            "phone": "+1234567890",
+            "address": "123 Main St, City, Country"
         }
+    })
 
 class CustomerResponse(BaseModel):
     """Response model for customer data"""
@@ -48,12 +57,24 @@ class CustomerResponse(BaseModel):
     created_at: datetime = Field(..., description="Customer creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v)
-        }
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "CustomerResponse":
+        """Build a response straight from a database row (read path)
+        
+        OPTIMIZATION: skips the intermediate Customer model; model_construct skips
+        validation - rows come from our own database
+        """
+        return cls.model_construct(
+            id=row['id'],
+            name=row['name'],
+            email=row['email'],
+            phone=row['phone'],
+            address=row['address'],
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+    
+    model_config = ConfigDict(from_attributes=True)
 
 class Customer(BaseModel):
     """Domain model for Customer"""
@@ -65,6 +86,22 @@ class Customer(BaseModel):
     created_at: datetime
     updated_at: datetime
     
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "Customer":
+        """Hydrate from a trusted database row
+        
+        OPTIMIZATION: model_construct skips validation - the row was validated on write
+        """
+        return cls.model_construct(
+            id=row['id'],
+            name=row['name'],
+            email=row['email'],
+            phone=row['phone'],
+            address=row['address'],
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+    
     @classmethod
     def create_new(
         cls,
@@ -105,15 +142,8 @@ class Customer(BaseModel):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert customer to dictionary"""
-        return {
-            "id": str(self.id),
-            "name": self.name,
-            "email": self.email,
-            "phone": self.phone,
-            "address": self.address,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
-        }
+        # pydantic-core formats UUID/datetime/enum values in Rust
+        return self.model_dump(mode="json")
 
 class CustomerNotFoundError(Exception):
     """Exception raised when customer is not found"""
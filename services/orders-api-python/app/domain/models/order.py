@@ -1,10 +1,11 @@
 # Domain Models and Business Logic
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Mapping
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from enum import Enum
-import json
+import orjson
 
 class OrderStatus(str, Enum):
     """Order status enumeration"""
@@ -14,29 +15,39 @@ class OrderStatus(str, Enum):
     FAILED = "FAILED"
     CANCELLED = "CANCELLED"
 
+# OPTIMIZATION: Plain dict lookup for row hydration, skipping EnumMeta.__call__
+_ORDER_STATUS_BY_VALUE: Dict[str, OrderStatus] = dict(OrderStatus._value2member_map_)
+
+def _order_status_from_row(value: str) -> OrderStatus:
+    """Resolve a stored status string; the only realistic failure when hydrating a row"""
+    status = _ORDER_STATUS_BY_VALUE.get(value)
+    if status is None:
+        raise ValueError(f"Unknown order status in database row: {value!r}")
+    return status
+
 class OrderCreateRequest(BaseModel):
     """Request model for creating an order"""
     customer_id: UUID = Field(..., description="Customer identifier")
     product_id: UUID = Field(..., description="Product identifier")
     quantity: int = Field(..., gt=0, le=1000, description="Quantity of items")
-    total_amount: float = Field(..., gt=0, description="Total amount for the order")
+    total_amount: float = Field(..., gt=0, le=100000, description="Total amount for the order")
     
-    @validator('total_amount')
+    @field_validator('total_amount')
+    @classmethod
     def validate_total_amount(cls, v):
         """Validate total amount precision"""
         if round(v, 2) != v:
             raise ValueError('Total amount must have at most 2 decimal places')
         return v
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "customer_id": "550e8400-e29b-41d4-a716-446655440000",
-                "product_id": "550e8400-e29b-41d4-a716-446655440001", 
-                "quantity": 2,
-                "total_amount": 99.98
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "customer_id": "550e8400-e29b-41d4-a716-446655440000",
+            "product_id": "550e8400-e29b-41d4-a716-446655440001", 
+            "quantity": 2,
+            "total_amount": 99.98
         }
+    })
 
 class OrderResponse(BaseModel):
     """Response model for order data"""
@@ -49,12 +60,44 @@ class OrderResponse(BaseModel):
     created_at: datetime = Field(..., description="Order creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v)
-        }
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "OrderResponse":
+        """Build a response straight from a database row (read path)
+        
+        OPTIMIZATION: skips the intermediate Order model; model_construct skips
+        validation and the status is resolved with a plain dict lookup - rows come
+        from our own database
+        """
+        return cls.model_construct(
+            id=row['id'],
+            customer_id=row['customer_id'],
+            product_id=row['product_id'],
+            quantity=row['quantity'],
+            total_amount=float(row['total_amount']),
+            status=_order_status_from_row(row['status']),
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+    
+    @classmethod
+    def from_domain(cls, order: "Order") -> "OrderResponse":
+        """Build a response from a domain Order
+        
+        OPTIMIZATION: model_construct skips validation (including the OrderStatus
+        enum lookup) - Order is already validated
+        """
+        return cls.model_construct(
+            id=order.id,
+            customer_id=order.customer_id,
+            product_id=order.product_id,
+            quantity=order.quantity,
+            total_amount=order.total_amount,
+            status=order.status,
+            created_at=order.created_at,
+            updated_at=order.updated_at
+        )
+    
+    model_config = ConfigDict(from_attributes=True)
 
 class Order(BaseModel):
     """Domain model for Order"""
@@ -67,6 +110,23 @@ class Order(BaseModel):
     created_at: datetime
     updated_at: datetime
     
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "Order":
+        """Hydrate from a trusted database row
+        
+        OPTIMIZATION: model_construct skips validation - the row was validated on write
+        """
+        return cls.model_construct(
+            id=row['id'],
+            customer_id=row['customer_id'],
+            product_id=row['product_id'],
+            quantity=row['quantity'],
+            total_amount=float(row['total_amount']),
+            status=_order_status_from_row(row['status']),
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+    
     @classmethod
     def create_new(
         cls,
@@ -75,9 +135,13 @@ class Order(BaseModel):
         quantity: int,
         total_amount: float
     ) -> "Order":
-        """Create a new order"""
+        """Create a new order
+        
+        OPTIMIZATION: model_construct skips validation - the arguments come from an
+        already validated OrderCreateRequest
+        """
         now = datetime.utcnow()
-        return cls(
+        return cls.model_construct(
             id=uuid4(),
             customer_id=customer_id,
             product_id=product_id,
@@ -95,19 +159,16 @@ class Order(BaseModel):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert order to dictionary"""
-        return {
-            "id": str(self.id),
-            "customer_id": str(self.customer_id),
-            "product_id": str(self.product_id),
-            "quantity": self.quantity,
-            "total_amount": self.total_amount,
-            "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
-        }
+        # pydantic-core formats UUID/datetime/enum values in Rust
+        return self.model_dump(mode="json")
 
-class OutboxEvent(BaseModel):
-    """Domain model for Outbox Event"""
+@dataclass(slots=True)
+class OutboxEvent:
+    """Domain model for Outbox Event
+    
+    Internal type, never part of the API: a slotted dataclass rather than a pydantic
+    model, since it is only ever built by our own code or from our own rows
+    """
     id: UUID
     aggregate_id: UUID
     aggregate_type: str
@@ -119,6 +180,25 @@ class OutboxEvent(BaseModel):
     retry_count: int = 0
     max_retries: int = 3
     
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "OutboxEvent":
+        """Hydrate from a trusted database row (event_data may arrive as JSON text)"""
+        event_data = row['event_data']
+        if isinstance(event_data, (str, bytes)):
+            event_data = orjson.loads(event_data)
+        return cls(
+            id=row['id'],
+            aggregate_id=row['aggregate_id'],
+            aggregate_type=row['aggregate_type'],
+            event_type=row['event_type'],
+            event_data=event_data,
+            created_at=row['created_at'],
+            processed_at=row['processed_at'],
+            status=row['status'],
+            retry_count=row['retry_count'],
+            max_retries=row['max_retries']
+        )
+    
     @classmethod
     def create_order_created_event(
         cls,
@@ -165,7 +245,7 @@ class OutboxEvent(BaseModel):
             "aggregate_id": str(self.aggregate_id),
             "aggregate_type": self.aggregate_type,
             "event_type": self.event_type,
-            "event_data": json.dumps(self.event_data),
+            "event_data": orjson.dumps(self.event_data).decode("utf-8"),
             "created_at": self.created_at.isoformat(),
             "processed_at": self.processed_at.isoformat() if self.processed_at else None,
             "status": self.status,
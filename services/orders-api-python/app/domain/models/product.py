@@ -1,60 +1,63 @@
 # Domain Models - Product
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Annotated, Optional, Dict, Any, Mapping
 from uuid import UUID, uuid4
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints, field_validator
+
+# SKUs are trimmed and length-checked inside pydantic-core
+SkuStr = Annotated[str, StringConstraints(strip_whitespace=True, max_length=100)]
 
 class ProductCreateRequest(BaseModel):
     """Request model for creating a product"""
     name: str = Field(..., min_length=1, max_length=255, description="Product name")
     description: Optional[str] = Field(None, description="Product description")
     price: float = Field(..., gt=0, description="Product price")
-    sku: Optional[str] = Field(None, max_length=100, description="Product SKU")
+    sku: Optional[SkuStr] = Field(None, description="Product SKU")
     stock_quantity: int = Field(0, ge=0, description="Initial stock quantity")
     
-    @validator('price')
+    @field_validator('price')
+    @classmethod
     def validate_price(cls, v):
         """Validate price precision"""
         if round(v, 2) != v:
             raise ValueError('Price must have at most 2 decimal places')
         return v
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "Product Name",
-                "description": "Product description",
-                "price": 99.99,
-                "sku": "PROD-001",
-                "stock_quantity": 100
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "name": "Product Name",
+            "description": "Product description",
+            "price": 99.99,
+            "sku": "PROD-001",
+            "stock_quantity": 100
         }
+    })
 
 class ProductUpdateRequest(BaseModel):
     """Request model for updating a product"""
     name: str = Field(..., min_length=1, max_length=255, description="Product name")
     description: Optional[str] = Field(None, description="Product description")
     price: float = Field(..., gt=0, description="Product price")
-    sku: Optional[str] = Field(None, max_length=100, description="Product SKU")
+    sku: Optional[SkuStr] = Field(None, description="Product SKU")
     stock_quantity: int = Field(..., ge=0, description="Stock quantity")
     
-    @validator('price')
+    @field_validator('price')
+    @classmethod
     def validate_price(cls, v):
         """Validate price precision"""
         if round(v, 2) != v:
             raise ValueError('Price must have at most 2 decimal places')
         return v
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "name": "Product Name",
-                "description": "Product description",
-                "price": 99.99,
-                "sku": "PROD-001",
-                "stock_quantity": 100
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "name": "Product Name",
+            "description": "Product description",
+            "price": 99.99,
+            "sku": "PROD-001",
+            "stock_quantity": 100
         }
+    })
 
 class ProductResponse(BaseModel):
     """Response model for product data"""
@@ -67,12 +70,25 @@ class ProductResponse(BaseModel):
     created_at: datetime = Field(..., description="Product creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v)
-        }
+    @classmethod
+    def from_domain(cls, product: "Product") -> "ProductResponse":
+        """Build a response from a domain Product
+        
+        OPTIMIZATION: model_construct skips validation - Product is already validated
+        """
+        return cls.model_construct(
+            id=product.id,
+            name=product.name,
+            description=product.description,
+            price=product.price,
+            sku=product.sku,
+            stock_quantity=product.stock_quantity,
+            created_at=product.created_at,
+            updated_at=product.updated_at
+        )
+    
+    # Responses are read-only snapshots of a Product
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class Product(BaseModel):
     """Domain model for Product"""
@@ -85,6 +101,23 @@ class Product(BaseModel):
     created_at: datetime
     updated_at: datetime
     
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "Product":
+        """Hydrate from a trusted database row
+        
+        OPTIMIZATION: model_construct skips validation - the row was validated on write
+        """
+        return cls.model_construct(
+            id=row['id'],
+            name=row['name'],
+            description=row['description'],
+            price=float(row['price']),
+            sku=row['sku'],
+            stock_quantity=row['stock_quantity'],
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+    
     @classmethod
     def create_new(
         cls,
@@ -127,16 +160,8 @@ class Product(BaseModel):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert product to dictionary"""
-        return {
-            "id": str(self.id),
-            "name": self.name,
-            "description": self.description,
-            "price": self.price,
-            "sku": self.sku,
-            "stock_quantity": self.stock_quantity,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
-        }
+        # pydantic-core formats UUID/datetime/enum values in Rust
+        return self.model_dump(mode="json")
 
 class ProductNotFoundError(Exception):
     """Exception raised when product is not found"""
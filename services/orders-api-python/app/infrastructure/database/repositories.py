@@ -1,52 +1,194 @@
 # Infrastructure Layer - Database Repositories
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from uuid import UUID
 import asyncpg
-import orjson
 import logging
 
 from app.domain.models.order import Order, OutboxEvent, OrderStatus
 from app.domain.models.product import Product
-from app.domain.models.customer import Customer
+from app.domain.models.customer import Customer, DuplicateEmailError
 from app.domain.interfaces.repositories import (
     OrderRepositoryInterface,
     OutboxEventRepositoryInterface,
     ProductRepositoryInterface,
     CustomerRepositoryInterface
 )
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.database import db_manager
 from app.core.logging import LoggerMixin
-from app.core.profiling import profiler
 
 logger = logging.getLogger(__name__)
 
+def _rows_affected(status: str) -> int:
+    """Row count from an asyncpg command status tag such as 'UPDATE 3' or 'DELETE 0'"""
+    return int(status.rpartition(" ")[2])
+
+# Reserve stock, insert order and insert outbox event in one statement.
+# The order (and its event) is only inserted when the stock reservation succeeds.
+# The order.created payload is built from the inserted row with jsonb_build_object,
+# so no OutboxEvent is constructed or JSON-serialized in Python. Keys and formats
+# match OutboxEvent.create_order_created_event (created_at as naive UTC ISO-8601).
+_CREATE_ORDER_ATOMIC_SQL = """
+    WITH reserved AS (
+        UPDATE products
+        SET stock_quantity = stock_quantity - $4::integer, updated_at = NOW()
+        WHERE id = $3::uuid AND stock_quantity >= $4::integer
+        RETURNING id
+    ),
+    new_order AS (
+        INSERT INTO orders (id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at)
+        SELECT $1::uuid, $2::uuid, reserved.id, $4::integer, $5::numeric, $6::varchar, $7::timestamptz, $8::timestamptz
+        FROM reserved
+        RETURNING id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
+    ),
+    new_event AS (
+        INSERT INTO outbox_events (id, aggregate_id, aggregate_type, event_type, event_data, created_at)
+        SELECT gen_random_uuid(), new_order.id, 'Order', 'order.created',
+               jsonb_build_object(
+                   'order_id', new_order.id,
+                   'customer_id', new_order.customer_id,
+                   'product_id', new_order.product_id,
+                   'quantity', new_order.quantity,
+                   'total_amount', new_order.total_amount::float8,
+                   'created_at', new_order.created_at AT TIME ZONE 'UTC',
+                   'trace_id', $9::varchar,
+                   'span_id', $10::varchar
+               ),
+               NOW()
+        FROM new_order
+    )
+    SELECT id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
+    FROM new_order
+"""
+
+# Hot order reads, kept as constants so the SQL text (asyncpg's statement cache key)
+# is identical between the warm-up and the repository calls. The list queries cast
+# total_amount to float8 so pages decode a binary double instead of numeric text
+_GET_ORDER_BY_ID_SQL = """
+    SELECT id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
+    FROM orders
+    WHERE id = $1
+"""
+
+_LIST_ORDERS_BY_CUSTOMER_SQL = """
+    SELECT id, customer_id, product_id, quantity, total_amount::float8 AS total_amount, status, created_at, updated_at
+    FROM orders
+    WHERE customer_id = $1
+    ORDER BY created_at DESC, id DESC
+    LIMIT $2
+"""
+
+_LIST_ORDERS_BY_CUSTOMER_AFTER_SQL = """
+    SELECT id, customer_id, product_id, quantity, total_amount::float8 AS total_amount, status, created_at, updated_at
+    FROM orders
+    WHERE customer_id = $1 AND (created_at, id) < ($2, $3)
+    ORDER BY created_at DESC, id DESC
+    LIMIT $4
+"""
+
+# Deprecated OFFSET paging, kept for clients that still send ?offset=
+_LIST_ORDERS_BY_CUSTOMER_OFFSET_SQL = """
+    SELECT id, customer_id, product_id, quantity, total_amount::float8 AS total_amount, status, created_at, updated_at
+    FROM orders
+    WHERE customer_id = $1
+    ORDER BY created_at DESC, id DESC
+    LIMIT $2 OFFSET $3
+"""
+
+_INSERT_ORDER_SQL = """
+    INSERT INTO orders (id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    RETURNING id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
+"""
+
+_UPDATE_ORDER_SQL = """
+    UPDATE orders
+    SET customer_id = $2, product_id = $3, quantity = $4, total_amount = $5, 
+        status = $6, updated_at = $7
+    WHERE id = $1
+    RETURNING id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
+"""
+
+_UPDATE_ORDER_STATUS_SQL = """
+    UPDATE orders
+    SET status = $2, updated_at = NOW()
+    WHERE id = $1
+"""
+
+_UPDATE_ORDERS_STATUS_SQL = """
+    UPDATE orders
+    SET status = $2, updated_at = NOW()
+    WHERE id = ANY($1::uuid[])
+    RETURNING id
+"""
+
+_DELETE_ORDER_SQL = "DELETE FROM orders WHERE id = $1"
+
+_LIST_ORDERS_SQL = """
+    SELECT id, customer_id, product_id, quantity, total_amount::float8 AS total_amount, status, created_at, updated_at
+    FROM orders
+    ORDER BY created_at DESC
+    LIMIT $1 OFFSET $2
+"""
+
+_RESERVE_STOCK_SQL = """
+    UPDATE products
+    SET stock_quantity = stock_quantity - $2, updated_at = NOW()
+    WHERE id = $1 AND stock_quantity >= $2
+    RETURNING stock_quantity
+"""
+
+_GET_ORDERS_BY_IDS_SQL = """
+    SELECT id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
+    FROM orders
+    WHERE id = ANY($1::uuid[])
+"""
+
+# Prepare the hot reads on every new pooled connection (nil UUID matches no row)
+_NIL_UUID = UUID(int=0)
+db_manager.register_warmup(_GET_ORDER_BY_ID_SQL, _NIL_UUID)
+db_manager.register_warmup(_LIST_ORDERS_BY_CUSTOMER_SQL, _NIL_UUID, 1)
+db_manager.register_warmup(_LIST_ORDERS_BY_CUSTOMER_AFTER_SQL, _NIL_UUID, datetime.fromtimestamp(0, timezone.utc), _NIL_UUID, 1)
+# The write path too: with the nil product id the stock UPDATE matches no row, so
+# the CTE inserts nothing - but its plan is cached for create_order_atomic and the
+# executemany in create_batch_with_outbox. Main pool only: reads never run it
+db_manager.register_warmup(
+    _CREATE_ORDER_ATOMIC_SQL,
+    _NIL_UUID, _NIL_UUID, _NIL_UUID, 1, 0.0, OrderStatus.PENDING.value,
+    datetime.fromtimestamp(0, timezone.utc), datetime.fromtimestamp(0, timezone.utc), None, None,
+    write=True
+)
+
+# OPTIMIZATION: Read-through cache for get_by_id (clients poll order status).
+# Short TTL because other workers' writes only become visible when entries expire;
+# writes through this repository invalidate their own entry immediately
+_order_cache = TTLCache(
+    maxsize=settings.order_cache_max_size,
+    ttl=settings.order_cache_ttl_seconds
+)
+
 class OrderRepository(OrderRepositoryInterface, LoggerMixin):
     """PostgreSQL implementation of Order repository"""
     
     async def create(self, order: Order) -> Order:
         """Create a new order"""
-        query = """
-            INSERT INTO orders (id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            RETURNING id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(
-                    query,
-                    order.id,
-                    order.customer_id,
-                    order.product_id,
-                    order.quantity,
-                    order.total_amount,
-                    order.status.value,
-                    order.created_at,
-                    order.updated_at
-                )
-                
-                return self._row_to_order(row)
-                
+            row = await db_manager.execute_one(
+                _INSERT_ORDER_SQL,
+                order.id,
+                order.customer_id,
+                order.product_id,
+                order.quantity,
+                order.total_amount,
+                order.status.value,
+                order.created_at,
+                order.updated_at
+            )
+            
+            return self._row_to_order(row)
+            
         except asyncpg.exceptions.IntegrityConstraintViolationError as e:
             self.log_error("Order creation failed - integrity error", error=str(e))
             raise
@@ -55,414 +197,469 @@ class OrderRepository(OrderRepositoryInterface, LoggerMixin):
             raise
     
     async def get_by_id(self, order_id: UUID) -> Optional[Order]:
-        """Get order by ID - Otimizado para performance"""
+        """Get order by ID - Otimizado para performance (cache em processo com TTL curto)"""
+        cached = _order_cache.get(order_id)
+        if cached is not None:
+            return cached
+        
         # Query otimizada: usa índice primário (id) que já existe
         # PostgreSQL automaticamente usa o índice UUID para busca rápida
-        query = """
-            SELECT id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
-            FROM orders
-            WHERE id = $1
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                # Usar prepared statement para melhor performance em queries repetidas
-                row = await conn.fetchrow(query, order_id)
-                
-                if row:
-                    return self._row_to_order(row)
-                return None
-                
+            # Prepared statement já aquecido no init da conexão
+            row = await db_manager.read_one(_GET_ORDER_BY_ID_SQL, order_id)
+            
+            if row:
+                order = self._row_to_order(row)
+                _order_cache.set(order_id, order)
+                return order
+            return None
+            
         except Exception as e:
             self.log_error("Failed to get order by ID", error=str(e), order_id=str(order_id))
             raise
     
     async def update(self, order: Order) -> Order:
         """Update an existing order"""
-        query = """
-            UPDATE orders
-            SET customer_id = $2, product_id = $3, quantity = $4, total_amount = $5, 
-                status = $6, updated_at = $7
-            WHERE id = $1
-            RETURNING id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(
-                    query,
-                    order.id,
-                    order.customer_id,
-                    order.product_id,
-                    order.quantity,
-                    order.total_amount,
-                    order.status.value,
-                    order.updated_at
-                )
-                
-                return self._row_to_order(row)
-                
+            row = await db_manager.execute_one(
+                _UPDATE_ORDER_SQL,
+                order.id,
+                order.customer_id,
+                order.product_id,
+                order.quantity,
+                order.total_amount,
+                order.status.value,
+                order.updated_at
+            )
+            _order_cache.invalidate(order.id)
+            
+            return self._row_to_order(row)
+            
         except Exception as e:
             self.log_error("Failed to update order", error=str(e), order_id=str(order.id))
             raise
     
     async def update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
         """Update order status only"""
-        query = """
-            UPDATE orders
-            SET status = $2, updated_at = NOW()
-            WHERE id = $1
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                result = await conn.execute(query, order_id, new_status.value)
-                return result == "UPDATE 1"
-                
+            result = await db_manager.execute_command(_UPDATE_ORDER_STATUS_SQL, order_id, new_status.value)
+            _order_cache.invalidate(order_id)
+            return _rows_affected(result) > 0
+            
         except Exception as e:
             self.log_error("Failed to update order status", error=str(e), order_id=str(order_id))
             raise
     
+    async def update_status_many(self, order_ids: List[UUID], new_status: OrderStatus) -> Set[UUID]:
+        """Set the same status on several orders in one statement. Returns the ids that were updated"""
+        if not order_ids:
+            return set()
+        try:
+            rows = await db_manager.execute_query(_UPDATE_ORDERS_STATUS_SQL, order_ids, new_status.value)
+            for order_id in order_ids:
+                _order_cache.invalidate(order_id)
+            return {row['id'] for row in rows}
+            
+        except Exception as e:
+            self.log_error("Failed to update order statuses", error=str(e), batch_size=len(order_ids))
+            raise
+    
     async def delete(self, order_id: UUID) -> bool:
         """Delete an order"""
-        query = "DELETE FROM orders WHERE id = $1"
-        
         try:
-            async with db_manager.get_connection() as conn:
-                result = await conn.execute(query, order_id)
-                return result == "DELETE 1"
-                
+            result = await db_manager.execute_command(_DELETE_ORDER_SQL, order_id)
+            _order_cache.invalidate(order_id)
+            return _rows_affected(result) > 0
+            
         except Exception as e:
             self.log_error("Failed to delete order", error=str(e), order_id=str(order_id))
             raise
     
-    async def list_by_customer(self, customer_id: UUID, limit: int = 100, offset: int = 0) -> List[Order]:
-        """List orders by customer ID - Otimizado com índice composto"""
-        # Query otimizada: usa índice idx_orders_customer_id + idx_orders_created_at
-        # Para melhor performance com ORDER BY created_at DESC
-        query = """
-            SELECT id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
-            FROM orders
-            WHERE customer_id = $1
-            ORDER BY created_at DESC
-            LIMIT $2 OFFSET $3
+    async def list_by_customer(self, customer_id: UUID, limit: int = 100, cursor: Optional[Tuple[datetime, UUID]] = None) -> List[Order]:
+        """List orders by customer ID - Keyset pagination
+        
+        Pages are addressed by the (created_at, id) of the last row of the previous
+        page instead of OFFSET, so every page costs O(limit) regardless of depth.
+        Uses índice idx_orders_customer_created_at (customer_id, created_at DESC, id DESC).
         """
+        rows = await self.list_by_customer_raw(customer_id, limit=limit, cursor=cursor)
+        return self._rows_to_orders(rows)
+    
+    async def list_by_customer_raw(
+        self,
+        customer_id: UUID,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
+        offset: int = 0
+    ) -> List[asyncpg.Record]:
+        """List orders by customer ID as raw records (read path, no domain model)
         
+        `offset` is the deprecated paging mode and is only used when no cursor is given
+        """
         try:
-            async with db_manager.get_connection() as conn:
-                # Usar prepared statement para queries repetidas
-                rows = await conn.fetch(query, customer_id, limit, offset)
-                return [self._row_to_order(row) for row in rows]
-                
+            if cursor is None:
+                if offset:
+                    return await db_manager.read_query(_LIST_ORDERS_BY_CUSTOMER_OFFSET_SQL, customer_id, limit, offset)
+                return await db_manager.read_query(_LIST_ORDERS_BY_CUSTOMER_SQL, customer_id, limit)
+            return await db_manager.read_query(_LIST_ORDERS_BY_CUSTOMER_AFTER_SQL, customer_id, cursor[0], cursor[1], limit)
+            
         except Exception as e:
             self.log_error("Failed to list orders by customer", error=str(e), customer_id=customer_id)
             raise
     
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[Order]:
         """List all orders - Otimizado com índice"""
-        query = """
-            SELECT id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
-            FROM orders
-            ORDER BY created_at DESC
-            LIMIT $1 OFFSET $2
-        """
-        
+        rows = await self.list_all_raw(limit=limit, offset=offset)
+        return self._rows_to_orders(rows)
+    
+    async def list_all_raw(self, limit: int = 100, offset: int = 0) -> List[asyncpg.Record]:
+        """List all orders as raw records (read path, no domain model)"""
         try:
-            async with db_manager.get_connection() as conn:
-                rows = await conn.fetch(query, limit, offset)
-                return [self._row_to_order(row) for row in rows]
-                
+            return await db_manager.read_query(_LIST_ORDERS_SQL, limit, offset)
+            
         except Exception as e:
             self.log_error("Failed to list all orders", error=str(e))
             raise
     
-    async def create_with_outbox_event(self, order: Order, outbox_event: OutboxEvent, product_id: UUID = None, quantity: int = None) -> Order:
-        """Create order, reserve stock, and outbox event in a single transaction (Transactional Outbox Pattern)
+    async def create_order_atomic(
+        self,
+        order: Order,
+        product_id: UUID,
+        quantity: int,
+        trace_id: Optional[str] = None,
+        span_id: Optional[str] = None
+    ) -> Optional[Order]:
+        """Reserve stock, create order and its order.created outbox event in a single round-trip
         
-        Optimized for performance with minimal transaction time:
-        - Uses explicit transaction for atomicity
-        - Executes INSERTs and UPDATE in sequence (all in same transaction)
-        - Prepared statements are automatically cached by asyncpg
-        - Transaction commits immediately after all operations
-        - JSON serialization done BEFORE transaction to reduce lock time
-        
-        If product_id and quantity are provided, stock will be reserved in the same transaction.
-        """
-        order_insert_query = """
-            INSERT INTO orders (id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            RETURNING id, customer_id, product_id, quantity, total_amount, status, created_at, updated_at
+        Uses a writable CTE so the stock reservation, the order INSERT and the
+        outbox INSERT run as one statement (one parse/bind/execute, one commit).
+        The order and the event are only inserted when the reservation succeeds,
+        so None is returned when the product does not exist or has insufficient stock.
         """
+        args = self._atomic_order_args(order, product_id, quantity, trace_id, span_id)
         
-        outbox_insert_query = """
-            INSERT INTO outbox_events (id, aggregate_id, aggregate_type, event_type, event_data, 
-                                     created_at, processed_at, status, retry_count, max_retries)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-        """
+        try:
+            row = await db_manager.execute_one(_CREATE_ORDER_ATOMIC_SQL, *args)
+            
+            if row is None:
+                return None
+            return self._row_to_order(row)
+            
+        except asyncpg.exceptions.IntegrityConstraintViolationError as e:
+            self.log_error("Atomic order creation failed - integrity error", error=str(e))
+            raise
+        except Exception as e:
+            self.log_error("Atomic order creation failed", error=str(e))
+            raise
+    
+    async def create_batch_with_outbox(
+        self,
+        orders: List[Order],
+        trace_contexts: List[Tuple[Optional[str], Optional[str]]]
+    ) -> List[Optional[Order]]:
+        """Create a batch of orders (with stock reservation and outbox events) in one transaction
         
-        stock_reserve_query = """
-            UPDATE products
-            SET stock_quantity = stock_quantity - $2, updated_at = NOW()
-            WHERE id = $1 AND stock_quantity >= $2
-            RETURNING stock_quantity
-        """
+        Runs the atomic order CTE once per order through executemany, which asyncpg
+        pipelines in a single network batch, then reads back the inserted orders.
+        Orders are applied in sequence, so several orders for the same product see
+        each other's reservations exactly as they would one by one. The whole batch
+        pays a single commit (one WAL flush) instead of one per order.
         
-        # OPTIMIZATION: Serialize JSON BEFORE transaction to reduce lock time
-        # orjson is 2-3x faster than json.dumps() and reduces transaction overhead
-        with profiler.measure("json_serialization"):
-            event_data_json = orjson.dumps(outbox_event.event_data).decode('utf-8')
+        `trace_contexts` holds the (trace_id, span_id) of each order, in order.
+        Returns one entry per input order, None where the stock reservation failed.
+        """
+        args = [
+            self._atomic_order_args(order, order.product_id, order.quantity, trace_id, span_id)
+            for order, (trace_id, span_id) in zip(orders, trace_contexts)
+        ]
         
         try:
-            with profiler.measure("db_connection"):
-                async with db_manager.get_connection() as conn:
-                    # Use explicit transaction with isolation level READ COMMITTED (default, fastest)
-                    # This ensures all operations are atomic but with minimal locking overhead
-                    with profiler.measure("db_transaction"):
-                        async with conn.transaction():
-                            # Reserve stock first (if provided) - this ensures stock is reserved before order creation
-                            if product_id and quantity is not None:
-                                with profiler.measure("db_reserve_stock"):
-                                    stock_row = await conn.fetchrow(
-                                        stock_reserve_query,
-                                        product_id,
-                                        quantity
-                                    )
-                                    if stock_row is None:
-                                        # No rows updated means insufficient stock
-                                        from app.domain.models.product import InsufficientStockError
-                                        raise InsufficientStockError(
-                                            f"Insufficient stock. Requested: {quantity}"
-                                        )
-                            
-                            # Insert order
-                            with profiler.measure("db_insert_order"):
-                                order_row = await conn.fetchrow(
-                                    order_insert_query,
-                                    order.id,
-                                    order.customer_id,
-                                    order.product_id,
-                                    order.quantity,
-                                    order.total_amount,
-                                    order.status.value,
-                                    order.created_at,
-                                    order.updated_at
-                                )
-                            
-                            # Insert outbox event immediately after (same transaction)
-                            # JSON already serialized before transaction to minimize lock time
-                            with profiler.measure("db_insert_outbox"):
-                                await conn.execute(
-                                    outbox_insert_query,
-                                    outbox_event.id,
-                                    outbox_event.aggregate_id,
-                                    outbox_event.aggregate_type,
-                                    outbox_event.event_type,
-                                    event_data_json,
-                                    outbox_event.created_at,
-                                    outbox_event.processed_at,
-                                    outbox_event.status,
-                                    outbox_event.retry_count,
-                                    outbox_event.max_retries
-                                )
-                    
-                    # Transaction commits automatically when exiting context
-                    with profiler.measure("db_row_conversion"):
-                        return self._row_to_order(order_row)
-                    
+            async with db_manager.get_connection() as conn:
+                async with conn.transaction():
+                    await conn.executemany(_CREATE_ORDER_ATOMIC_SQL, args)
+                    rows = await conn.fetch(_GET_ORDERS_BY_IDS_SQL, [order.id for order in orders])
+                
+                saved = {row['id']: self._row_to_order(row) for row in rows}
+                return [saved.get(order.id) for order in orders]
+                
         except asyncpg.exceptions.IntegrityConstraintViolationError as e:
-            self.log_error("Order creation with outbox event failed - integrity error", error=str(e))
+            self.log_error("Batch order creation failed - integrity error", error=str(e), batch_size=len(orders))
             raise
         except Exception as e:
-            self.log_error("Order creation with outbox event failed", error=str(e))
+            self.log_error("Batch order creation failed", error=str(e), batch_size=len(orders))
             raise
     
+    @staticmethod
+    def _atomic_order_args(
+        order: Order,
+        product_id: UUID,
+        quantity: int,
+        trace_id: Optional[str],
+        span_id: Optional[str]
+    ) -> tuple:
+        """Build the positional arguments for _CREATE_ORDER_ATOMIC_SQL"""
+        return (
+            order.id,
+            order.customer_id,
+            product_id,
+            quantity,
+            order.total_amount,
+            order.status.value,
+            order.created_at,
+            order.updated_at,
+            trace_id,
+            span_id
+        )
+    
+    def _rows_to_orders(self, rows: List[asyncpg.Record]) -> List[Order]:
+        """Convert database rows to Order domain models"""
+        return list(map(Order.from_row, rows))
+    
     def _row_to_order(self, row: asyncpg.Record) -> Order:
-        """Convert database row to Order domain model"""
-        try:
-            # Convert status string to OrderStatus enum
-            status_str = row['status']
-            if isinstance(status_str, str):
-                status = OrderStatus(status_str)
-            else:
-                status = status_str
-            
-            return Order(
-                id=row['id'],
-                customer_id=row['customer_id'],
-                product_id=row['product_id'],
-                quantity=row['quantity'],
-                total_amount=float(row['total_amount']),
-                status=status,
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
-        except Exception as e:
-            self.log_error(
-                "Failed to convert row to order",
-                error=str(e),
-                order_id=str(row.get('id', 'unknown')),
-                status=str(row.get('status', 'unknown'))
-            )
-            raise
+        """Convert database row to Order domain model
+        
+        No try/log wrapper: Order.from_row raises a ValueError naming the bad status,
+        and callers already log failures at the query boundary
+        """
+        return Order.from_row(row)
+
+_INSERT_OUTBOX_EVENT_RETURNING_SQL = """
+    INSERT INTO outbox_events (id, aggregate_id, aggregate_type, event_type, event_data, 
+                             created_at, processed_at, status, retry_count, max_retries)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    RETURNING id, aggregate_id, aggregate_type, event_type, event_data, created_at, 
+             processed_at, status, retry_count, max_retries
+"""
+
+_LIST_PENDING_OUTBOX_EVENTS_SQL = """
+    SELECT id, aggregate_id, aggregate_type, event_type, event_data, created_at,
+           processed_at, status, retry_count, max_retries
+    FROM outbox_events
+    WHERE status = 'PENDING'
+    ORDER BY created_at ASC
+    LIMIT $1
+"""
+
+_UPDATE_OUTBOX_EVENT_SQL = """
+    UPDATE outbox_events
+    SET processed_at = $2, status = $3, retry_count = $4
+    WHERE id = $1
+    RETURNING id, aggregate_id, aggregate_type, event_type, event_data, created_at,
+             processed_at, status, retry_count, max_retries
+"""
+
+_MARK_OUTBOX_EVENT_PROCESSED_SQL = """
+    UPDATE outbox_events
+    SET status = 'PROCESSED', processed_at = NOW()
+    WHERE id = $1
+"""
+
+_INCREMENT_OUTBOX_EVENT_RETRY_SQL = """
+    UPDATE outbox_events
+    SET retry_count = retry_count + 1,
+        status = CASE WHEN retry_count >= max_retries THEN 'FAILED' ELSE 'PENDING' END
+    WHERE id = $1
+"""
 
 class OutboxEventRepository(OutboxEventRepositoryInterface, LoggerMixin):
     """PostgreSQL implementation of Outbox Event repository"""
     
     async def create(self, event: OutboxEvent) -> OutboxEvent:
         """Create a new outbox event"""
-        query = """
-            INSERT INTO outbox_events (id, aggregate_id, aggregate_type, event_type, event_data, 
-                                     created_at, processed_at, status, retry_count, max_retries)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-            RETURNING id, aggregate_id, aggregate_type, event_type, event_data, created_at, 
-                     processed_at, status, retry_count, max_retries
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(
-                    query,
-                    event.id,
-                    event.aggregate_id,
-                    event.aggregate_type,
-                    event.event_type,
-                    event.event_data,
-                    event.created_at,
-                    event.processed_at,
-                    event.status,
-                    event.retry_count,
-                    event.max_retries
-                )
-                
-                return self._row_to_event(row)
-                
+            row = await db_manager.execute_one(
+                _INSERT_OUTBOX_EVENT_RETURNING_SQL,
+                event.id,
+                event.aggregate_id,
+                event.aggregate_type,
+                event.event_type,
+                event.event_data,
+                event.created_at,
+                event.processed_at,
+                event.status,
+                event.retry_count,
+                event.max_retries
+            )
+            
+            return self._row_to_event(row)
+            
         except Exception as e:
             self.log_error("Failed to create outbox event", error=str(e))
             raise
     
     async def get_pending_events(self, limit: int = 100) -> List[OutboxEvent]:
         """Get pending events for processing"""
-        query = """
-            SELECT id, aggregate_id, aggregate_type, event_type, event_data, created_at,
-                   processed_at, status, retry_count, max_retries
-            FROM outbox_events
-            WHERE status = 'PENDING'
-            ORDER BY created_at ASC
-            LIMIT $1
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                rows = await conn.fetch(query, limit)
-                return [self._row_to_event(row) for row in rows]
-                
+            rows = await db_manager.execute_query(_LIST_PENDING_OUTBOX_EVENTS_SQL, limit)
+            return [self._row_to_event(row) for row in rows]
+            
         except Exception as e:
             self.log_error("Failed to get pending events", error=str(e))
             raise
     
     async def update(self, event: OutboxEvent) -> OutboxEvent:
         """Update an existing event"""
-        query = """
-            UPDATE outbox_events
-            SET processed_at = $2, status = $3, retry_count = $4
-            WHERE id = $1
-            RETURNING id, aggregate_id, aggregate_type, event_type, event_data, created_at,
-                     processed_at, status, retry_count, max_retries
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(
-                    query,
-                    event.id,
-                    event.processed_at,
-                    event.status,
-                    event.retry_count
-                )
-                
-                return self._row_to_event(row)
-                
+            row = await db_manager.execute_one(
+                _UPDATE_OUTBOX_EVENT_SQL,
+                event.id,
+                event.processed_at,
+                event.status,
+                event.retry_count
+            )
+            
+            return self._row_to_event(row)
+            
         except Exception as e:
             self.log_error("Failed to update outbox event", error=str(e), event_id=str(event.id))
             raise
     
     async def mark_as_processed(self, event_id: UUID) -> bool:
         """Mark event as processed"""
-        query = """
-            UPDATE outbox_events
-            SET status = 'PROCESSED', processed_at = NOW()
-            WHERE id = $1
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                result = await conn.execute(query, event_id)
-                return result == "UPDATE 1"
-                
+            result = await db_manager.execute_command(_MARK_OUTBOX_EVENT_PROCESSED_SQL, event_id)
+            return _rows_affected(result) > 0
+            
         except Exception as e:
             self.log_error("Failed to mark event as processed", error=str(e), event_id=str(event_id))
             raise
     
     async def increment_retry(self, event_id: UUID) -> bool:
         """Increment retry count for event"""
-        query = """
-            UPDATE outbox_events
-            SET retry_count = retry_count + 1,
-                status = CASE WHEN retry_count >= max_retries THEN 'FAILED' ELSE 'PENDING' END
-            WHERE id = $1
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                result = await conn.execute(query, event_id)
-                return result == "UPDATE 1"
-                
+            result = await db_manager.execute_command(_INCREMENT_OUTBOX_EVENT_RETRY_SQL, event_id)
+            return _rows_affected(result) > 0
+            
         except Exception as e:
             self.log_error("Failed to increment retry count", error=str(e), event_id=str(event_id))
             raise
     
     def _row_to_event(self, row: asyncpg.Record) -> OutboxEvent:
         """Convert database row to OutboxEvent domain model"""
-        return OutboxEvent(
-            id=row['id'],
-            aggregate_id=row['aggregate_id'],
-            aggregate_type=row['aggregate_type'],
-            event_type=row['event_type'],
-            event_data=row['event_data'],
-            created_at=row['created_at'],
-            processed_at=row['processed_at'],
-            status=row['status'],
-            retry_count=row['retry_count'],
-            max_retries=row['max_retries']
-        )
+        return OutboxEvent.from_row(row)
+
+_GET_PRODUCT_BY_ID_SQL = """
+    SELECT id, name, description, price, sku, stock_quantity, created_at, updated_at
+    FROM products
+    WHERE id = $1
+"""
+
+_GET_PRODUCT_BY_SKU_SQL = """
+    SELECT id, name, description, price, sku, stock_quantity, created_at, updated_at
+    FROM products
+    WHERE sku = $1
+"""
+
+_PRODUCT_EXISTS_SQL = "SELECT EXISTS(SELECT 1 FROM products WHERE id = $1)"
+
+def _utc_timestamp_json_sql(column: str) -> str:
+    """SQL rendering a timestamptz the way pydantic serializes it (UTC, "Z" suffix,
+    fraction only when non-zero), independent of the session TimeZone"""
+    return (
+        f"to_char({column} AT TIME ZONE 'UTC', 'YYYY-MM-DD\"T\"HH24:MI:SS')"
+        f" || CASE WHEN date_trunc('second', {column}) = {column} THEN ''"
+        f" ELSE to_char({column} AT TIME ZONE 'UTC', '.US') END || 'Z'"
+    )
+
+_LIST_PRODUCTS_JSON_SQL = f"""
+    SELECT COALESCE(
+        json_agg(json_build_object(
+            'id', p.id,
+            'name', p.name,
+            'description', p.description,
+            'price', p.price::float8,
+            'sku', p.sku,
+            'stock_quantity', p.stock_quantity,
+            'created_at', {_utc_timestamp_json_sql("p.created_at")},
+            'updated_at', {_utc_timestamp_json_sql("p.updated_at")}
+        ) ORDER BY p.created_at DESC),
+        '[]'
+    )::text
+    FROM (
+        SELECT id, name, description, price, sku, stock_quantity, created_at, updated_at
+        FROM products
+        ORDER BY created_at DESC
+        LIMIT $1 OFFSET $2
+    ) p
+"""
+
+_INSERT_PRODUCT_SQL = """
+    INSERT INTO products (id, name, description, price, sku, stock_quantity, created_at, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    RETURNING id, name, description, price, sku, stock_quantity, created_at, updated_at
+"""
+
+_INSERT_PRODUCT_IF_SKU_UNIQUE_SQL = """
+    INSERT INTO products (id, name, description, price, sku, stock_quantity, created_at, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    ON CONFLICT (sku) DO NOTHING
+    RETURNING id, name, description, price, sku, stock_quantity, created_at, updated_at
+"""
+
+_GET_PRODUCTS_BY_IDS_SQL = """
+    SELECT id, name, description, price, sku, stock_quantity, created_at, updated_at
+    FROM products
+    WHERE id = ANY($1::uuid[])
+"""
+
+_UPDATE_PRODUCT_SQL = """
+    UPDATE products
+    SET name = $2, description = $3, price = $4, sku = $5, 
+        stock_quantity = $6, updated_at = NOW()
+    WHERE id = $1
+    RETURNING id, name, description, price, sku, stock_quantity, created_at, updated_at
+"""
+
+_DELETE_PRODUCT_SQL = "DELETE FROM products WHERE id = $1"
+
+_LIST_PRODUCTS_SQL = """
+    SELECT id, name, description, price, sku, stock_quantity, created_at, updated_at
+    FROM products
+    ORDER BY created_at DESC
+    LIMIT $1 OFFSET $2
+"""
+
+_UPDATE_PRODUCT_STOCK_SQL = """
+    UPDATE products
+    SET stock_quantity = stock_quantity + $2, updated_at = NOW()
+    WHERE id = $1
+    RETURNING stock_quantity
+"""
+
+# Product reads are warmed the same way as the order reads above
+db_manager.register_warmup(_GET_PRODUCT_BY_ID_SQL, _NIL_UUID)
+db_manager.register_warmup(_GET_PRODUCT_BY_SKU_SQL, "")
+db_manager.register_warmup(_PRODUCT_EXISTS_SQL, _NIL_UUID)
+db_manager.register_warmup(_LIST_PRODUCTS_JSON_SQL, 0, 0)
+
+# OPTIMIZATION: Product existence rarely changes but is checked on order creation.
+# Shared by every ProductRepository instance; only positive results are cached so a
+# newly created product is visible immediately
+_product_exists_cache = TTLCache(
+    maxsize=settings.product_cache_max_size,
+    ttl=settings.product_cache_ttl_seconds
+)
 
 class ProductRepository(ProductRepositoryInterface, LoggerMixin):
     """PostgreSQL implementation of Product repository"""
     
     async def create(self, product: Product) -> Product:
         """Create a new product"""
-        query = """
-            INSERT INTO products (id, name, description, price, sku, stock_quantity, created_at, updated_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            RETURNING id, name, description, price, sku, stock_quantity, created_at, updated_at
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(
-                    query,
-                    product.id,
-                    product.name,
-                    product.description,
-                    product.price,
-                    product.sku,
-                    product.stock_quantity,
-                    product.created_at,
-                    product.updated_at
-                )
-                
-                return self._row_to_product(row)
-                
+            row = await db_manager.execute_one(
+                _INSERT_PRODUCT_SQL,
+                product.id,
+                product.name,
+                product.description,
+                product.price,
+                product.sku,
+                product.stock_quantity,
+                product.created_at,
+                product.updated_at
+            )
+            
+            return self._row_to_product(row)
+            
         except asyncpg.exceptions.UniqueViolationError as e:
             self.log_error("Product creation failed - duplicate SKU", error=str(e))
             raise
@@ -472,184 +669,255 @@ class ProductRepository(ProductRepositoryInterface, LoggerMixin):
     
     async def get_by_id(self, product_id: UUID) -> Optional[Product]:
         """Get product by ID"""
-        query = """
-            SELECT id, name, description, price, sku, stock_quantity, created_at, updated_at
-            FROM products
-            WHERE id = $1
-        """
+        try:
+            row = await db_manager.read_one(_GET_PRODUCT_BY_ID_SQL, product_id)
+            
+            if row:
+                return self._row_to_product(row)
+            return None
+            
+        except Exception as e:
+            self.log_error("Failed to get product by ID", error=str(e), product_id=str(product_id))
+            raise
+    
+    async def create_if_sku_unique(self, product: Product) -> Optional[Product]:
+        """Create a new product unless its SKU is already taken
         
+        The unique constraint on sku decides in the same statement (ON CONFLICT DO
+        NOTHING returns no row), replacing a get_by_sku pre-check and its race.
+        Returns None on SKU conflict.
+        """
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(query, product_id)
-                
-                if row:
-                    return self._row_to_product(row)
+            row = await db_manager.execute_one(
+                _INSERT_PRODUCT_IF_SKU_UNIQUE_SQL,
+                product.id,
+                product.name,
+                product.description,
+                product.price,
+                product.sku,
+                product.stock_quantity,
+                product.created_at,
+                product.updated_at
+            )
+            
+            if row is None:
                 return None
-                
+            return self._row_to_product(row)
+            
         except Exception as e:
-            self.log_error("Failed to get product by ID", error=str(e), product_id=str(product_id))
+            self.log_error("Product creation failed", error=str(e))
+            raise
+    
+    async def exists(self, product_id: UUID) -> bool:
+        """Check whether a product exists (cached in-process for a short TTL)"""
+        if _product_exists_cache.get(product_id):
+            return True
+        
+        try:
+            found = await db_manager.read_scalar(_PRODUCT_EXISTS_SQL, product_id)
+            if found:
+                _product_exists_cache.set(product_id, True)
+            return found
+            
+        except Exception as e:
+            self.log_error("Failed to check product existence", error=str(e), product_id=str(product_id))
+            raise
+    
+    async def get_many_by_ids(self, ids: Sequence[UUID]) -> Dict[UUID, Product]:
+        """Get several products in one query (avoids N+1 get_by_id calls)"""
+        if not ids:
+            return {}
+        
+        try:
+            rows = await db_manager.read_query(_GET_PRODUCTS_BY_IDS_SQL, list(ids))
+            return {row['id']: self._row_to_product(row) for row in rows}
+            
+        except Exception as e:
+            self.log_error("Failed to get products by IDs", error=str(e), count=len(ids))
             raise
     
     async def get_by_sku(self, sku: str) -> Optional[Product]:
         """Get product by SKU"""
-        query = """
-            SELECT id, name, description, price, sku, stock_quantity, created_at, updated_at
-            FROM products
-            WHERE sku = $1
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(query, sku)
-                
-                if row:
-                    return self._row_to_product(row)
-                return None
-                
+            row = await db_manager.read_one(_GET_PRODUCT_BY_SKU_SQL, sku)
+            
+            if row:
+                return self._row_to_product(row)
+            return None
+            
         except Exception as e:
             self.log_error("Failed to get product by SKU", error=str(e), sku=sku)
             raise
     
     async def update(self, product: Product) -> Product:
-        """Update an existing product"""
-        query = """
-            UPDATE products
-            SET name = $2, description = $3, price = $4, sku = $5, 
-                stock_quantity = $6, updated_at = $7
-            WHERE id = $1
-            RETURNING id, name, description, price, sku, stock_quantity, created_at, updated_at
-        """
-        
+        """Update an existing product (updated_at is assigned by the database)"""
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(
-                    query,
-                    product.id,
-                    product.name,
-                    product.description,
-                    product.price,
-                    product.sku,
-                    product.stock_quantity,
-                    product.updated_at
-                )
-                
-                return self._row_to_product(row)
-                
+            row = await db_manager.execute_one(
+                _UPDATE_PRODUCT_SQL,
+                product.id,
+                product.name,
+                product.description,
+                product.price,
+                product.sku,
+                product.stock_quantity
+            )
+            
+            return self._row_to_product(row)
+            
         except Exception as e:
             self.log_error("Failed to update product", error=str(e), product_id=str(product.id))
             raise
     
     async def delete(self, product_id: UUID) -> bool:
         """Delete a product"""
-        query = "DELETE FROM products WHERE id = $1"
-        
         try:
-            async with db_manager.get_connection() as conn:
-                result = await conn.execute(query, product_id)
-                return result == "DELETE 1"
-                
+            result = await db_manager.execute_command(_DELETE_PRODUCT_SQL, product_id)
+            _product_exists_cache.invalidate(product_id)
+            return _rows_affected(result) > 0
+            
         except Exception as e:
             self.log_error("Failed to delete product", error=str(e), product_id=str(product_id))
             raise
     
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[Product]:
         """List all products"""
-        query = """
-            SELECT id, name, description, price, sku, stock_quantity, created_at, updated_at
-            FROM products
-            ORDER BY created_at DESC
-            LIMIT $1 OFFSET $2
-        """
+        try:
+            rows = await db_manager.read_query(_LIST_PRODUCTS_SQL, limit, offset)
+            return [self._row_to_product(row) for row in rows]
+            
+        except Exception as e:
+            self.log_error("Failed to list products", error=str(e))
+            raise
+    
+    async def list_all_json(self, limit: int = 100, offset: int = 0) -> str:
+        """List all products as a JSON array built by PostgreSQL
         
+        OPTIMIZATION: json_agg serializes the page server-side, skipping the
+        Record -> Product -> ProductResponse -> JSON round trip in Python
+        """
         try:
-            async with db_manager.get_connection() as conn:
-                rows = await conn.fetch(query, limit, offset)
-                return [self._row_to_product(row) for row in rows]
-                
+            return await db_manager.read_scalar(_LIST_PRODUCTS_JSON_SQL, limit, offset)
+            
         except Exception as e:
             self.log_error("Failed to list products", error=str(e))
             raise
     
     async def update_stock(self, product_id: UUID, quantity: int) -> bool:
         """Update product stock quantity (add or subtract)"""
-        query = """
-            UPDATE products
-            SET stock_quantity = stock_quantity + $2, updated_at = NOW()
-            WHERE id = $1
-            RETURNING stock_quantity
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(query, product_id, quantity)
-                if row and row['stock_quantity'] < 0:
-                    return False
-                return True
-                
+            row = await db_manager.execute_one(_UPDATE_PRODUCT_STOCK_SQL, product_id, quantity)
+            if row and row['stock_quantity'] < 0:
+                return False
+            return True
+            
         except Exception as e:
             self.log_error("Failed to update stock", error=str(e), product_id=str(product_id))
             raise
     
     async def reserve_stock(self, product_id: UUID, quantity: int) -> bool:
         """Reserve stock by decreasing quantity. Returns True if successful, False if insufficient stock."""
-        query = """
-            UPDATE products
-            SET stock_quantity = stock_quantity - $2, updated_at = NOW()
-            WHERE id = $1 AND stock_quantity >= $2
-            RETURNING stock_quantity
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(query, product_id, quantity)
-                if row is None:
-                    # No rows updated means insufficient stock
-                    return False
-                return True
-                
+            row = await db_manager.execute_one(_RESERVE_STOCK_SQL, product_id, quantity)
+            if row is None:
+                # No rows updated means insufficient stock
+                return False
+            return True
+            
         except Exception as e:
             self.log_error("Failed to reserve stock", error=str(e), product_id=str(product_id))
             raise
     
     def _row_to_product(self, row: asyncpg.Record) -> Product:
         """Convert database row to Product domain model"""
-        return Product(
-            id=row['id'],
-            name=row['name'],
-            description=row['description'],
-            price=float(row['price']),
-            sku=row['sku'],
-            stock_quantity=row['stock_quantity'],
-            created_at=row['created_at'],
-            updated_at=row['updated_at']
-        )
+        return Product.from_row(row)
+
+_INSERT_CUSTOMER_SQL = """
+    INSERT INTO customers (id, name, email, phone, address, created_at, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+    ON CONFLICT (email) DO NOTHING
+    RETURNING id, name, email, phone, address, created_at, updated_at
+"""
+
+_GET_CUSTOMER_BY_ID_SQL = """
+    SELECT id, name, email, phone, address, created_at, updated_at
+    FROM customers
+    WHERE id = $1
+"""
+
+_GET_CUSTOMER_BY_EMAIL_SQL = """
+    SELECT id, name, email, phone, address, created_at, updated_at
+    FROM customers
+    WHERE email = $1
+"""
+
+_UPDATE_CUSTOMER_SQL = """
+    UPDATE customers
+    SET name = $2, email = $3, phone = $4, address = $5, updated_at = $6
+    WHERE id = $1
+    RETURNING id, name, email, phone, address, created_at, updated_at
+"""
+
+_UPDATE_CUSTOMER_INFO_SQL = """
+    UPDATE customers
+    SET name = $2, email = $3, phone = $4, address = $5, updated_at = NOW()
+    WHERE id = $1
+    RETURNING id, name, email, phone, address, created_at, updated_at
+"""
+
+_DELETE_CUSTOMER_SQL = "DELETE FROM customers WHERE id = $1"
+
+_LIST_CUSTOMERS_SQL = """
+    SELECT id, name, email, phone, address, created_at, updated_at
+    FROM customers
+    ORDER BY created_at DESC
+    LIMIT $1 OFFSET $2
+"""
+
+# Keyset pages (idx_customers_created_at on (created_at DESC, id DESC)): every page
+# costs O(limit), where OFFSET scans and discards all the skipped rows
+_LIST_CUSTOMERS_PAGE_SQL = """
+    SELECT id, name, email, phone, address, created_at, updated_at
+    FROM customers
+    ORDER BY created_at DESC, id DESC
+    LIMIT $1
+"""
+
+_LIST_CUSTOMERS_PAGE_AFTER_SQL = """
+    SELECT id, name, email, phone, address, created_at, updated_at
+    FROM customers
+    WHERE (created_at, id) < ($2, $3)
+    ORDER BY created_at DESC, id DESC
+    LIMIT $1
+"""
 
 class CustomerRepository(CustomerRepositoryInterface, LoggerMixin):
     """PostgreSQL implementation of Customer repository"""
     
     async def create(self, customer: Customer) -> Customer:
-        """Create a new customer"""
-        query = """
-            INSERT INTO customers (id, name, email, phone, address, created_at, updated_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-            RETURNING id, name, email, phone, address, created_at, updated_at
-        """
+        """Create a new customer. Raises DuplicateEmailError if the email is taken
         
+        The unique index on email decides in the same statement (ON CONFLICT DO
+        NOTHING returns no row), so no prior lookup is needed and two concurrent
+        creates with the same email cannot both succeed.
+        """
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(
-                    query,
-                    customer.id,
-                    customer.name,
-                    customer.email,
-                    customer.phone,
-                    customer.address,
-                    customer.created_at,
-                    customer.updated_at
-                )
-                
-                return self._row_to_customer(row)
-                
+            row = await db_manager.execute_one(
+                _INSERT_CUSTOMER_SQL,
+                customer.id,
+                customer.name,
+                customer.email,
+                customer.phone,
+                customer.address,
+                customer.created_at,
+                customer.updated_at
+            )
+            
+            if row is None:
+                raise DuplicateEmailError(f"Customer with email {customer.email} already exists")
+            return self._row_to_customer(row)
+            
+        except DuplicateEmailError:
+            raise
         except asyncpg.exceptions.UniqueViolationError as e:
             self.log_error("Customer creation failed - duplicate email", error=str(e))
             raise
@@ -659,110 +927,115 @@ class CustomerRepository(CustomerRepositoryInterface, LoggerMixin):
     
     async def get_by_id(self, customer_id: UUID) -> Optional[Customer]:
         """Get customer by ID"""
-        query = """
-            SELECT id, name, email, phone, address, created_at, updated_at
-            FROM customers
-            WHERE id = $1
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(query, customer_id)
-                
-                if row:
-                    return self._row_to_customer(row)
-                return None
-                
+            row = await db_manager.read_one(_GET_CUSTOMER_BY_ID_SQL, customer_id)
+            
+            if row:
+                return self._row_to_customer(row)
+            return None
+            
         except Exception as e:
             self.log_error("Failed to get customer by ID", error=str(e), customer_id=str(customer_id))
             raise
     
     async def get_by_email(self, email: str) -> Optional[Customer]:
         """Get customer by email"""
-        query = """
-            SELECT id, name, email, phone, address, created_at, updated_at
-            FROM customers
-            WHERE email = $1
-        """
-        
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(query, email)
-                
-                if row:
-                    return self._row_to_customer(row)
-                return None
-                
+            row = await db_manager.read_one(_GET_CUSTOMER_BY_EMAIL_SQL, email)
+            
+            if row:
+                return self._row_to_customer(row)
+            return None
+            
         except Exception as e:
             self.log_error("Failed to get customer by email", error=str(e), email=email)
             raise
     
     async def update(self, customer: Customer) -> Customer:
         """Update an existing customer"""
-        query = """
-            UPDATE customers
-            SET name = $2, email = $3, phone = $4, address = $5, updated_at = $6
-            WHERE id = $1
-            RETURNING id, name, email, phone, address, created_at, updated_at
-        """
+        try:
+            row = await db_manager.execute_one(
+                _UPDATE_CUSTOMER_SQL,
+                customer.id,
+                customer.name,
+                customer.email,
+                customer.phone,
+                customer.address,
+                customer.updated_at
+            )
+            
+            return self._row_to_customer(row)
+            
+        except Exception as e:
+            self.log_error("Failed to update customer", error=str(e), customer_id=str(customer.id))
+            raise
+    
+    async def update_info(
+        self,
+        customer_id: UUID,
+        name: str,
+        email: str,
+        phone: Optional[str],
+        address: Optional[str]
+    ) -> Optional[Customer]:
+        """Update customer information in a single round-trip
         
+        Existence and email uniqueness are enforced by the UPDATE itself (WHERE id
+        and the unique index on email), avoiding separate lookups and the race
+        between checking and writing.
+        """
         try:
-            async with db_manager.get_connection() as conn:
-                row = await conn.fetchrow(
-                    query,
-                    customer.id,
-                    customer.name,
-                    customer.email,
-                    customer.phone,
-                    customer.address,
-                    customer.updated_at
-                )
-                
+            row = await db_manager.execute_one(_UPDATE_CUSTOMER_INFO_SQL, customer_id, name, email, phone, address)
+            
+            if row:
                 return self._row_to_customer(row)
-                
+            return None
+            
+        except asyncpg.exceptions.UniqueViolationError:
+            raise DuplicateEmailError(f"Customer with email {email} already exists")
         except Exception as e:
-            self.log_error("Failed to update customer", error=str(e), customer_id=str(customer.id))
+            self.log_error("Failed to update customer", error=str(e), customer_id=str(customer_id))
             raise
     
     async def delete(self, customer_id: UUID) -> bool:
         """Delete a customer"""
-        query = "DELETE FROM customers WHERE id = $1"
-        
         try:
-            async with db_manager.get_connection() as conn:
-                result = await conn.execute(query, customer_id)
-                return result == "DELETE 1"
-                
+            result = await db_manager.execute_command(_DELETE_CUSTOMER_SQL, customer_id)
+            return _rows_affected(result) > 0
+            
         except Exception as e:
             self.log_error("Failed to delete customer", error=str(e), customer_id=str(customer_id))
             raise
     
     async def list_all(self, limit: int = 100, offset: int = 0) -> List[Customer]:
         """List all customers"""
-        query = """
-            SELECT id, name, email, phone, address, created_at, updated_at
-            FROM customers
-            ORDER BY created_at DESC
-            LIMIT $1 OFFSET $2
-        """
+        rows = await self.list_all_raw(limit=limit, offset=offset)
+        return [self._row_to_customer(row) for row in rows]
+    
+    async def list_all_raw(self, limit: int = 100, offset: int = 0) -> List[asyncpg.Record]:
+        """List all customers as raw records (read path, no domain model)"""
+        try:
+            return await db_manager.read_query(_LIST_CUSTOMERS_SQL, limit, offset)
+            
+        except Exception as e:
+            self.log_error("Failed to list customers", error=str(e))
+            raise
+    
+    async def list_page_raw(self, limit: int = 100, cursor: Optional[Tuple[datetime, UUID]] = None) -> List[asyncpg.Record]:
+        """List a keyset page of customers as raw records (read path, no domain model)
         
+        Pages are addressed by the (created_at, id) of the last row of the previous
+        page instead of OFFSET, so every page costs O(limit) regardless of depth.
+        """
         try:
-            async with db_manager.get_connection() as conn:
-                rows = await conn.fetch(query, limit, offset)
-                return [self._row_to_customer(row) for row in rows]
-                
+            if cursor is None:
+                return await db_manager.read_query(_LIST_CUSTOMERS_PAGE_SQL, limit)
+            return await db_manager.read_query(_LIST_CUSTOMERS_PAGE_AFTER_SQL, limit, cursor[0], cursor[1])
+            
         except Exception as e:
             self.log_error("Failed to list customers", error=str(e))
             raise
     
     def _row_to_customer(self, row: asyncpg.Record) -> Customer:
         """Convert database row to Customer domain model"""
-        return Customer(
-            id=row['id'],
-            name=row['name'],
-            email=row['email'],
-            phone=row['phone'],
-            address=row['address'],
-            created_at=row['created_at'],
-            updated_at=row['updated_at']
-        )
+        return Customer.from_row(row)
@@ -1,13 +1,16 @@
 # Infrastructure Layer - RabbitMQ Consumer for Inventory Events
 import asyncio
-import json
+import functools
 import logging
 from uuid import UUID
 import aio_pika
+import orjson
 from aio_pika import IncomingMessage
 
 from app.domain.models.order import OrderStatus
 from app.infrastructure.database.repositories import OrderRepository
+from app.application.services.order_status_batcher import OrderStatusBatcher
+from app.core.config import settings
 from app.core.logging import LoggerMixin
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,16 @@ class InventoryEventConsumer(LoggerMixin):
     
     def __init__(self, order_repository: OrderRepository):
         self.order_repository = order_repository
+        # Concurrent deliveries (up to the prefetch window) share one UPDATE per status
+        self.status_batcher = (
+            OrderStatusBatcher(
+                order_repository,
+                max_batch_size=settings.order_status_batch_max_size,
+                flush_interval_ms=settings.order_status_batch_flush_interval_ms
+            )
+            if settings.order_status_batching_enabled
+            else None
+        )
         self.connection = None
         self.channel = None
         self.reserved_queue = None
@@ -27,7 +40,10 @@ class InventoryEventConsumer(LoggerMixin):
         try:
             self.connection = await aio_pika.connect_robust(rabbitmq_url)
             self.channel = await self.connection.channel()
-            await self.channel.set_qos(prefetch_count=10)
+            # Handlers are a short UPDATE each; a deeper window keeps the consumer busy
+            # while updates are in flight. Both queues share this channel, so the prefetch
+            # also bounds how many handlers (and DB writes) run concurrently
+            await self.channel.set_qos(prefetch_count=settings.rabbitmq_prefetch)
             
             # Declare exchange
             exchange = await self.channel.declare_exchange(
@@ -69,63 +85,25 @@ class InventoryEventConsumer(LoggerMixin):
         except Exception as e:
             self.log_error("Error disconnecting from RabbitMQ", error=str(e))
     
-    async def process_reserved_message(self, message: IncomingMessage):
-        """Process inventory.reserved event message"""
-        async with message.process():
-            try:
-                # Parse message
-                event_data = json.loads(message.body.decode())
-                
-                self.log_info("Received inventory.reserved event", event_data=event_data)
-                
-                order_id = event_data.get("orderId") or event_data.get("order_id")
-                status = event_data.get("status")
-                
-                if not order_id:
-                    self.log_error("Missing order_id in inventory event", event_data=event_data)
-                    return
-                
-                if status != "reserved":
-                    self.log_info("Ignoring inventory event with status", status=status, order_id=order_id)
-                    return
-                
-                # Update order status to COMPLETED
-                order_uuid = UUID(order_id)
-                success = await self.order_repository.update_status(
-                    order_uuid,
-                    OrderStatus.COMPLETED
-                )
-                
-                if success:
-                    self.log_info(
-                        "Order status updated to COMPLETED",
-                        order_id=order_id,
-                        operation="process_inventory_reserved"
-                    )
-                else:
-                    self.log_error(
-                        "Failed to update order status",
-                        order_id=order_id,
-                        operation="process_inventory_reserved"
-                    )
-                    
-            except json.JSONDecodeError as e:
-                self.log_error("Failed to parse inventory event message", error=str(e))
-            except ValueError as e:
-                self.log_error("Invalid UUID in inventory event", error=str(e))
-            except Exception as e:
-                self.log_error("Failed to process inventory event", error=str(e))
-                # Re-raise to trigger nack
-                raise
+    async def _update_status(self, order_id: UUID, new_status: OrderStatus) -> bool:
+        """Update the order status, batched with concurrent deliveries when enabled
+        
+        The message is acked only after this returns, i.e. after its batch is applied;
+        a failed batch raises here so every message in it is nacked
+        """
+        if self.status_batcher is not None:
+            return await self.status_batcher.submit(order_id, new_status)
+        return await self.order_repository.update_status(order_id, new_status)
     
-    async def process_rejected_message(self, message: IncomingMessage):
-        """Process inventory.rejected event message"""
+    async def _process_status_event(self, message: IncomingMessage, expected: str, new_status: OrderStatus):
+        """Process an inventory.<expected> event message by moving the order to `new_status`"""
+        operation = f"process_inventory_{expected}"
         async with message.process():
             try:
                 # Parse message
-                event_data = json.loads(message.body.decode())
+                event_data = orjson.loads(message.body)
                 
-                self.log_info("Received inventory.rejected event", event_data=event_data)
+                self.log_info(f"Received inventory.{expected} event", event_data=event_data)
                 
                 order_id = event_data.get("orderId") or event_data.get("order_id")
                 status = event_data.get("status")
@@ -134,31 +112,27 @@ class InventoryEventConsumer(LoggerMixin):
                     self.log_error("Missing order_id in inventory event", event_data=event_data)
                     return
                 
-                if status != "rejected":
+                if status != expected:
                     self.log_info("Ignoring inventory event with status", status=status, order_id=order_id)
                     return
                 
-                # Update order status to FAILED
                 order_uuid = UUID(order_id)
-                success = await self.order_repository.update_status(
-                    order_uuid,
-                    OrderStatus.FAILED
-                )
+                success = await self._update_status(order_uuid, new_status)
                 
                 if success:
                     self.log_info(
-                        "Order status updated to FAILED",
+                        f"Order status updated to {new_status.name}",
                         order_id=order_id,
-                        operation="process_inventory_rejected"
+                        operation=operation
                     )
                 else:
                     self.log_error(
                         "Failed to update order status",
                         order_id=order_id,
-                        operation="process_inventory_rejected"
+                        operation=operation
                     )
                     
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 self.log_error("Failed to parse inventory event message", error=str(e))
             except ValueError as e:
                 self.log_error("Invalid UUID in inventory event", error=str(e))
@@ -175,7 +149,11 @@ class InventoryEventConsumer(LoggerMixin):
         self.log_info("Starting to consume inventory.reserved and inventory.rejected events")
         
         # Start consuming from both queues
-        await self.reserved_queue.consume(self.process_reserved_message)
-        await self.rejected_queue.consume(self.process_rejected_message)
+        await self.reserved_queue.consume(
+            functools.partial(self._process_status_event, expected="reserved", new_status=OrderStatus.COMPLETED)
+        )
+        await self.rejected_queue.consume(
+            functools.partial(self._process_status_event, expected="rejected", new_status=OrderStatus.FAILED)
+        )
         
         self.log_info("Started consuming inventory.reserved and inventory.rejected events")
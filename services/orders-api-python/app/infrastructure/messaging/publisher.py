@@ -1,8 +1,8 @@
 # Infrastructure Layer - Event Publisher
-import json
 import logging
-from typing import Optional
+from typing import Dict, Optional
 import aio_pika
+import orjson
 from aio_pika import Message, DeliveryMode
 
 from app.domain.models.order import Order, OutboxEvent
@@ -12,6 +12,18 @@ from app.core.logging import LoggerMixin
 
 logger = logging.getLogger(__name__)
 
+# Routing key per event type (event types not listed route under their own name)
+_ROUTING_KEYS: Dict[str, str] = {
+    "order.created": "order.created",
+    "payment.authorized": "payment.authorized",
+    "payment.declined": "payment.declined",
+    "inventory.reserved": "inventory.reserved",
+    "inventory.rejected": "inventory.rejected",
+    "notification.sent": "notification.sent",
+}
+
+_PERSISTENT = DeliveryMode.PERSISTENT
+
 class RabbitMQEventPublisher(EventPublisherInterface, LoggerMixin):
     """RabbitMQ implementation of Event Publisher"""
     
@@ -46,24 +58,14 @@ class RabbitMQEventPublisher(EventPublisherInterface, LoggerMixin):
     
     async def publish_event(self, event: OutboxEvent) -> bool:
         """Publish an event to message broker"""
+        event_id = str(event.id)
         try:
             if not self.channel or self.channel.is_closed:
                 await self.connect()
             
             # Determine routing key based on event type
             routing_key = self._get_routing_key(event.event_type)
-            
-            # Create message
-            message = Message(
-                body=json.dumps(event.event_data).encode(),
-                delivery_mode=DeliveryMode.PERSISTENT,
-                message_id=str(event.id),
-                headers={
-                    "event_type": event.event_type,
-                    "aggregate_id": str(event.aggregate_id),
-                    "aggregate_type": event.aggregate_type,
-                }
-            )
+            message = self._build_event_message(event, event_id)
             
             # Publish message
             await self.channel.default_exchange.publish(
@@ -73,7 +75,7 @@ class RabbitMQEventPublisher(EventPublisherInterface, LoggerMixin):
             
             self.log_info(
                 "Event published successfully",
-                event_id=str(event.id),
+                event_id=event_id,
                 event_type=event.event_type,
                 routing_key=routing_key,
                 operation="publish_event"
@@ -85,7 +87,7 @@ class RabbitMQEventPublisher(EventPublisherInterface, LoggerMixin):
             self.log_error(
                 "Failed to publish event",
                 error=str(e),
-                event_id=str(event.id),
+                event_id=event_id,
                 event_type=event.event_type,
                 operation="publish_event"
             )
@@ -98,15 +100,16 @@ class RabbitMQEventPublisher(EventPublisherInterface, LoggerMixin):
         span_id: Optional[str] = None
     ) -> bool:
         """Publish order.created event"""
+        order_id = str(order.id)
         try:
-            # Create event data
+            # Create event data - UUID and datetime values are serialized by orjson in C
             event_data = {
-                "order_id": str(order.id),
+                "order_id": order.id,
                 "customer_id": order.customer_id,
                 "product_id": order.product_id,
                 "quantity": order.quantity,
                 "total_amount": order.total_amount,
-                "created_at": order.created_at.isoformat(),
+                "created_at": order.created_at,
                 "trace_id": trace_id,
                 "span_id": span_id
             }
@@ -116,13 +119,14 @@ class RabbitMQEventPublisher(EventPublisherInterface, LoggerMixin):
             
             # Create message
             message = Message(
-                body=json.dumps(event_data).encode(),
-                delivery_mode=DeliveryMode.PERSISTENT,
-                message_id=str(order.id),
+                body=orjson.dumps(event_data),
+                delivery_mode=_PERSISTENT,
+                message_id=order_id,
                 headers={
                     "event_type": "order.created",
-                    "order_id": str(order.id),
-                    "customer_id": order.customer_id,
+                    "order_id": order_id,
+                    # AMQP header tables have no UUID type
+                    "customer_id": str(order.customer_id),
                 }
             )
             
@@ -134,7 +138,7 @@ class RabbitMQEventPublisher(EventPublisherInterface, LoggerMixin):
             
             self.log_info(
                 "Order created event published successfully",
-                order_id=str(order.id),
+                order_id=order_id,
                 customer_id=order.customer_id,
                 product_id=order.product_id,
                 trace_id=trace_id,
@@ -148,7 +152,7 @@ class RabbitMQEventPublisher(EventPublisherInterface, LoggerMixin):
             self.log_error(
                 "Failed to publish order created event",
                 error=str(e),
-                order_id=str(order.id),
+                order_id=order_id,
                 customer_id=order.customer_id,
                 trace_id=trace_id,
                 span_id=span_id,
@@ -156,18 +160,23 @@ class RabbitMQEventPublisher(EventPublisherInterface, LoggerMixin):
             )
             return False
     
+    def _build_event_message(self, event: OutboxEvent, event_id: Optional[str] = None) -> Message:
+        """Build the persistent AMQP message for an outbox event"""
+        return Message(
+            # orjson encodes straight to bytes (and handles UUID/datetime values)
+            body=orjson.dumps(event.event_data),
+            delivery_mode=_PERSISTENT,
+            message_id=event_id or str(event.id),
+            headers={
+                "event_type": event.event_type,
+                "aggregate_id": str(event.aggregate_id),
+                "aggregate_type": event.aggregate_type,
+            }
+        )
+    
     def _get_routing_key(self, event_type: str) -> str:
         """Get routing key for event type"""
-        routing_keys = {
-            "order.created": "order.created",
-            "payment.authorized": "payment.authorized",
-            "payment.declined": "payment.declined",
-            "inventory.reserved": "inventory.reserved",
-            "inventory.rejected": "inventory.rejected",
-            "notification.sent": "notification.sent",
-        }
-        
-        return routing_keys.get(event_type, event_type)
+        return _ROUTING_KEYS.get(event_type, event_type)
 
 # Global event publisher instance
 event_publisher = RabbitMQEventPublisher()
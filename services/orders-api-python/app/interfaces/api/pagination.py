@@ -0,0 +1,23 @@
+# Interface Layer - Keyset Pagination Cursors
+import base64
+from datetime import datetime
+from typing import Tuple
+from uuid import UUID
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(cursor: Tuple[datetime, UUID]) -> str:
+    """Encode a (created_at, id) keyset position as an opaque URL-safe token"""
+    created_at, row_id = cursor
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def decode_cursor(token: str) -> Tuple[datetime, UUID]:
+    """Decode an opaque cursor token. Raises ValueError if the token is malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(token.encode()).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
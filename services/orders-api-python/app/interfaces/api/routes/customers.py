@@ -1,8 +1,9 @@
 # Interface Layer - API Routes - Customers
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from typing import List, Optional
 from uuid import UUID
 import logging
+from pydantic import TypeAdapter
 
 from app.domain.models.customer import (
     CustomerCreateRequest,
@@ -19,12 +20,18 @@ from app.application.use_cases.customer_use_cases import (
     UpdateCustomerUseCase
 )
 from app.infrastructure.database.repositories import CustomerRepository
+from app.interfaces.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.interfaces.api.request_body import body_openapi, parse_body
 
 logger = logging.getLogger(__name__)
 
 # Create router
 router = APIRouter()
 
+# OPTIMIZATION: Serialize whole customer pages in one pass of pydantic-core and return
+# the bytes directly, skipping FastAPI's per-item re-validation against response_model
+_CUSTOMER_LIST_ADAPTER = TypeAdapter(List[CustomerResponse])
+
 # Create repository and use cases
 customer_repository = CustomerRepository()
 create_customer_use_case = CreateCustomerUseCase(customer_repository)
@@ -44,10 +51,12 @@ update_customer_use_case = UpdateCustomerUseCase(customer_repository)
         409: {"description": "Customer with email already exists"},
         422: {"description": "Validation error"},
         500: {"description": "Internal server error"}
-    }
+    },
+    openapi_extra=body_openapi(CustomerCreateRequest)
 )
-async def create_customer(request: CustomerCreateRequest) -> CustomerResponse:
+async def create_customer(raw_request: Request) -> CustomerResponse:
     """Create a new customer"""
+    request = await parse_body(raw_request, CustomerCreateRequest)
     try:
         customer_response = await create_customer_use_case.execute(request)
         return customer_response
@@ -76,29 +85,45 @@ async def create_customer(request: CustomerCreateRequest) -> CustomerResponse:
     description="Retrieve all customers",
     responses={
         200: {"description": "Customers found"},
+        400: {"description": "Invalid cursor"},
+        422: {"description": "Invalid limit or offset"},
         500: {"description": "Internal server error"}
     }
 )
 async def list_customers(
-    limit: int = 100,
-    offset: int = 0
+    # Bounds are enforced by pydantic-core while binding the parameters (422 on violation)
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    offset: int = Query(0, ge=0)
 ) -> List[CustomerResponse]:
-    """List all customers"""
+    """List all customers
+    
+    Keyset pagination: pass the X-Next-Cursor header of a page as `cursor`
+    to fetch the next one. The header is absent on the last page.
+    `offset` is deprecated and only used when no cursor is given.
+    """
     try:
-        if limit < 1 or limit > 1000:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Limit must be between 1 and 1000"
-            )
+        if offset and not cursor:
+            # Deprecated OFFSET paging, kept for existing clients
+            customers = await list_customers_use_case.execute(limit=limit, offset=offset)
+            return Response(content=_CUSTOMER_LIST_ADAPTER.dump_json(customers), media_type="application/json")
         
-        if offset < 0:
+        try:
+            decoded_cursor = decode_cursor(cursor) if cursor else None
+        except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Offset must be non-negative"
+                detail="Invalid cursor"
             )
         
-        customers = await list_customers_use_case.execute(limit=limit, offset=offset)
-        return customers
+        customers, next_cursor = await list_customers_use_case.execute_page(limit=limit, cursor=decoded_cursor)
+        
+        headers = {NEXT_CURSOR_HEADER: encode_cursor(next_cursor)} if next_cursor else None
+        return Response(
+            content=_CUSTOMER_LIST_ADAPTER.dump_json(customers),
+            media_type="application/json",
+            headers=headers
+        )
         
     except HTTPException:
         raise
@@ -151,10 +176,12 @@ async def get_customer(customer_id: UUID) -> CustomerResponse:
         409: {"description": "Customer with email already exists"},
         422: {"description": "Validation error"},
         500: {"description": "Internal server error"}
-    }
+    },
+    openapi_extra=body_openapi(CustomerUpdateRequest)
 )
-async def update_customer(customer_id: UUID, request: CustomerUpdateRequest) -> CustomerResponse:
+async def update_customer(customer_id: UUID, raw_request: Request) -> CustomerResponse:
     """Update a customer"""
+    request = await parse_body(raw_request, CustomerUpdateRequest)
     try:
         customer_response = await update_customer_use_case.execute(customer_id, request)
         return customer_response
@@ -1,82 +1,114 @@
 # Interface Layer - Health Check Routes
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
+import asyncio
 import logging
-from datetime import datetime
+import orjson
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 from app.core.database import db_manager
-from app.infrastructure.messaging.publisher import RabbitMQEventPublisher
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound per dependency check, so a hung dependency cannot stall the probe
+_CHECK_TIMEOUT_SECONDS = 1.0
+
+# Static part of every probe response, built once
+_SERVICE_INFO = {
+    "service": settings.otel_service_name,
+    "version": settings.app_version
+}
+
+class _ProbeResponse(ORJSONResponse):
+    """ORJSONResponse that formats UTC datetimes with a "Z" suffix (in C, via orjson)"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
+
 # Create router
 router = APIRouter()
 
-@router.get(
-    "/",
-    summary="Health check",
-    description="Check if the service is healthy and all dependencies are available",
-    responses={
-        200: {"description": "Service is healthy"},
-        503: {"description": "Service is unhealthy"}
-    }
-)
-async def health_check() -> JSONResponse:
-    """Health check endpoint"""
-    
-    health_status = {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "service": settings.otel_service_name,
-        "version": settings.app_version,
-        "checks": {}
-    }
-    
-    overall_healthy = True
-    
-    # Check database connection
+async def _check_database() -> Dict[str, str]:
+    """Probe the database; never raises"""
     try:
-        async with db_manager.get_connection() as conn:
-            await conn.fetchval("SELECT 1")
-        health_status["checks"]["database"] = {
+        await asyncio.wait_for(db_manager.ping(), timeout=_CHECK_TIMEOUT_SECONDS)
+        return {
             "status": "healthy",
             "message": "Database connection successful"
         }
     except Exception as e:
-        health_status["checks"]["database"] = {
+        return {
             "status": "unhealthy",
-            "message": f"Database connection failed: {str(e)}"
+            "message": f"Database connection failed: {str(e) or type(e).__name__}"
         }
-        overall_healthy = False
+
+async def _check_rabbitmq(app: Any) -> Dict[str, str]:
+    """Probe RabbitMQ; never raises
     
-    # Check RabbitMQ connection
+    OPTIMIZATION: Inspects the connection opened at startup (the inventory consumer's)
+    instead of opening a new TCP+AMQP connection on every probe
+    """
     try:
-        event_publisher = RabbitMQEventPublisher()
-        if not event_publisher.connection or event_publisher.connection.is_closed:
-            await event_publisher.connect()
+        inventory_consumer = getattr(app.state, "inventory_consumer", None)
+        connection = inventory_consumer.connection if inventory_consumer else None
+        if connection is None or connection.is_closed:
+            raise RuntimeError("RabbitMQ connection is closed")
         
-        health_status["checks"]["rabbitmq"] = {
+        return {
             "status": "healthy",
             "message": "RabbitMQ connection successful"
         }
     except Exception as e:
-        health_status["checks"]["rabbitmq"] = {
+        return {
             "status": "unhealthy",
             "message": f"RabbitMQ connection failed: {str(e)}"
         }
-        overall_healthy = False
+
+@router.get(
+    "/",
+    summary="Health check",
+    description="Check if the service is healthy and all dependencies are available",
+    responses={
+        200: {"description": "Service is healthy"},
+        503: {"description": "Service is unhealthy"}
+    }
+)
+async def health_check(request: Request) -> _ProbeResponse:
+    """Health check endpoint
+    
+    Probe endpoints return _ProbeResponse directly: FastAPI's jsonable_encoder pass
+    is skipped and orjson writes the bytes, timestamp included
+    """
+    
+    # Independent checks run concurrently: probe latency is the slowest check, not the sum
+    database_check, rabbitmq_check = await asyncio.gather(
+        _check_database(),
+        _check_rabbitmq(request.app)
+    )
+    
+    health_status = {
+        "status": "healthy",
+        "timestamp": datetime.now(timezone.utc),
+        **_SERVICE_INFO,
+        "checks": {
+            "database": database_check,
+            "rabbitmq": rabbitmq_check
+        }
+    }
+    
+    overall_healthy = all(check["status"] == "healthy" for check in health_status["checks"].values())
     
     # Set overall status
     if not overall_healthy:
         health_status["status"] = "unhealthy"
-        return JSONResponse(
+        return _ProbeResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             content=health_status
         )
     
-    return JSONResponse(
+    return _ProbeResponse(
         status_code=status.HTTP_200_OK,
         content=health_status
     )
@@ -90,20 +122,19 @@ async def health_check() -> JSONResponse:
         503: {"description": "Service is not ready"}
     }
 )
-async def readiness_check() -> JSONResponse:
+async def readiness_check() -> _ProbeResponse:
     """Readiness check endpoint"""
     
     readiness_status = {
         "status": "ready",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "service": settings.otel_service_name,
-        "version": settings.app_version
+        "timestamp": datetime.now(timezone.utc),
+        **_SERVICE_INFO
     }
     
     # For now, if the service is running, it's ready
     # In a more complex scenario, you might check if all required resources are available
     
-    return JSONResponse(
+    return _ProbeResponse(
         status_code=status.HTTP_200_OK,
         content=readiness_status
     )
@@ -116,17 +147,16 @@ async def readiness_check() -> JSONResponse:
         200: {"description": "Service is alive"}
     }
 )
-async def liveness_check() -> JSONResponse:
+async def liveness_check() -> _ProbeResponse:
     """Liveness check endpoint"""
     
     liveness_status = {
         "status": "alive",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "service": settings.otel_service_name,
-        "version": settings.app_version
+        "timestamp": datetime.now(timezone.utc),
+        **_SERVICE_INFO
     }
     
-    return JSONResponse(
+    return _ProbeResponse(
         status_code=status.HTTP_200_OK,
         content=liveness_status
     )
@@ -1,15 +1,19 @@
 # Interface Layer - API Routes
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response, status
 from fastapi.responses import JSONResponse
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 import logging
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.domain.models.order import OrderCreateRequest, OrderResponse, OrderNotFoundError, InvalidOrderDataError
 from app.domain.models.product import InsufficientStockError
 from app.application.use_cases.order_use_cases import CreateOrderUseCase, GetOrderUseCase, ListOrdersUseCase, ListAllOrdersUseCase
+from app.application.services.order_batcher import OrderCreationBatcher
+from app.interfaces.api.request_body import body_openapi, parse_body
 from app.infrastructure.database.repositories import OrderRepository, ProductRepository
+from app.interfaces.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.core.config import settings
 from app.core.logging import LoggerMixin
 
 logger = logging.getLogger(__name__)
@@ -17,6 +21,10 @@ logger = logging.getLogger(__name__)
 # Create router
 router = APIRouter()
 
+# OPTIMIZATION: Serialize whole order lists in one pass of pydantic-core and return the
+# bytes directly, skipping FastAPI's per-item re-validation against response_model
+_ORDER_LIST_ADAPTER = TypeAdapter(List[OrderResponse])
+
 class OrderController(LoggerMixin):
     """Controller for order operations"""
     
@@ -25,7 +33,20 @@ class OrderController(LoggerMixin):
         self.product_repository = ProductRepository()
         # CreateOrderUseCase now uses Transactional Outbox Pattern
         # Events are saved to outbox_events table and processed by outbox-dispatcher service
-        self.create_order_use_case = CreateOrderUseCase(self.order_repository, self.product_repository)
+        self.order_batcher = (
+            OrderCreationBatcher(
+                self.order_repository,
+                max_batch_size=settings.order_batch_max_size,
+                flush_interval_ms=settings.order_batch_flush_interval_ms
+            )
+            if settings.order_batching_enabled
+            else None
+        )
+        self.create_order_use_case = CreateOrderUseCase(
+            self.order_repository,
+            self.product_repository,
+            order_batcher=self.order_batcher
+        )
         self.get_order_use_case = GetOrderUseCase(self.order_repository)
         self.list_orders_use_case = ListOrdersUseCase(self.order_repository)
         self.list_all_orders_use_case = ListAllOrdersUseCase(self.order_repository)
@@ -44,14 +65,16 @@ order_controller = OrderController()
         400: {"description": "Invalid order data"},
         422: {"description": "Validation error"},
         500: {"description": "Internal server error"}
-    }
+    },
+    openapi_extra=body_openapi(OrderCreateRequest)
 )
 async def create_order(
-    request: OrderCreateRequest,
+    raw_request: Request,
     trace_id: str = None,
     span_id: str = None
 ) -> OrderResponse:
     """Create a new order"""
+    request = await parse_body(raw_request, OrderCreateRequest)
     try:
         order_response = await order_controller.create_order_use_case.execute(
             request=request,
@@ -85,18 +108,26 @@ async def create_order(
     description="Retrieve all orders for a specific customer",
     responses={
         200: {"description": "Orders found"},
-        422: {"description": "Invalid customer ID"},
+        400: {"description": "Invalid cursor"},
+        422: {"description": "Invalid customer ID, limit or offset"},
         500: {"description": "Internal server error"}
     }
 )
 async def list_orders_by_customer(
     customer_id: str,
-    limit: int = 100,
-    offset: int = 0,
+    # Bounds are enforced by pydantic-core while binding the parameters (422 on violation)
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    offset: int = Query(0, ge=0),
     trace_id: str = None,
     span_id: str = None
 ) -> List[OrderResponse]:
-    """List orders by customer ID"""
+    """List orders by customer ID
+    
+    Keyset pagination: pass the X-Next-Cursor header of a page as `cursor`
+    to fetch the next one. The header is absent on the last page.
+    `offset` is deprecated and only used when no cursor is given.
+    """
     try:
         # Validate and convert customer_id to UUID
         try:
@@ -107,28 +138,29 @@ async def list_orders_by_customer(
                 detail="Invalid customer ID format. Expected UUID."
             )
         
-        # Validate parameters
-        if limit < 1 or limit > 1000:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Limit must be between 1 and 1000"
-            )
-        
-        if offset < 0:
+        try:
+            decoded_cursor = decode_cursor(cursor) if cursor else None
+        except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Offset must be non-negative"
+                detail="Invalid cursor"
             )
         
-        orders = await order_controller.list_orders_use_case.execute(
+        orders, next_cursor = await order_controller.list_orders_use_case.execute(
             customer_id=customer_uuid,
             limit=limit,
-            offset=offset,
+            cursor=decoded_cursor,
             trace_id=trace_id,
-            span_id=span_id
+            span_id=span_id,
+            offset=offset
         )
         
-        return orders
+        headers = {NEXT_CURSOR_HEADER: encode_cursor(next_cursor)} if next_cursor else None
+        return Response(
+            content=_ORDER_LIST_ADAPTER.dump_json(orders),
+            media_type="application/json",
+            headers=headers
+        )
         
     except HTTPException:
         # Re-raise HTTPException to preserve status code and detail
@@ -217,7 +249,7 @@ async def list_recent_orders(
             span_id=span_id
         )
         
-        return orders
+        return Response(content=_ORDER_LIST_ADAPTER.dump_json(orders), media_type="application/json")
         
     except HTTPException:
         # Re-raise HTTPException to preserve status code and detail
@@ -1,6 +1,6 @@
 # Interface Layer - API Routes - Products
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from typing import List, Optional, Union
 from uuid import UUID
 import logging
 
@@ -14,10 +14,12 @@ from app.domain.models.product import (
 from app.application.use_cases.product_use_cases import (
     CreateProductUseCase,
     GetProductUseCase,
+    GetProductsByIdsUseCase,
     ListProductsUseCase,
     UpdateProductUseCase
 )
 from app.infrastructure.database.repositories import ProductRepository
+from app.interfaces.api.request_body import body_openapi, parse_body
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,7 @@ router = APIRouter()
 product_repository = ProductRepository()
 create_product_use_case = CreateProductUseCase(product_repository)
 get_product_use_case = GetProductUseCase(product_repository)
+get_products_by_ids_use_case = GetProductsByIdsUseCase(product_repository)
 list_products_use_case = ListProductsUseCase(product_repository)
 update_product_use_case = UpdateProductUseCase(product_repository)
 
@@ -42,10 +45,12 @@ update_product_use_case = UpdateProductUseCase(product_repository)
         400: {"description": "Invalid product data"},
         422: {"description": "Validation error"},
         500: {"description": "Internal server error"}
-    }
+    },
+    openapi_extra=body_openapi(ProductCreateRequest)
 )
-async def create_product(request: ProductCreateRequest) -> ProductResponse:
+async def create_product(raw_request: Request) -> ProductResponse:
     """Create a new product"""
+    request = await parse_body(raw_request, ProductCreateRequest)
     try:
         product_response = await create_product_use_case.execute(request)
         return product_response
@@ -64,20 +69,33 @@ async def create_product(request: ProductCreateRequest) -> ProductResponse:
 
 @router.get(
     "/",
-    response_model=List[ProductResponse],
+    response_model=None,
     summary="List all products",
-    description="Retrieve all products",
+    description="Retrieve all products, or only the products whose IDs are given in `ids`",
     responses={
-        200: {"description": "Products found"},
+        200: {"model": List[ProductResponse], "description": "Products found"},
         500: {"description": "Internal server error"}
     }
 )
 async def list_products(
     limit: int = 100,
-    offset: int = 0
-) -> List[ProductResponse]:
-    """List all products"""
+    offset: int = 0,
+    ids: Optional[List[UUID]] = Query(None, description="Fetch only these product IDs (repeat the parameter)")
+) -> Union[List[ProductResponse], Response]:
+    """List all products
+    
+    With `ids`, returns those products in one query - use it instead of one
+    GET /products/{id} per product when enriching lists of orders.
+    """
     try:
+        if ids:
+            if len(ids) > 1000:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="At most 1000 ids per request"
+                )
+            return await get_products_by_ids_use_case.execute(ids)
+        
         if limit < 1 or limit > 1000:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -90,8 +108,9 @@ async def list_products(
                 detail="Offset must be non-negative"
             )
         
-        products = await list_products_use_case.execute(limit=limit, offset=offset)
-        return products
+        # OPTIMIZATION: the page is serialized by PostgreSQL - pass it through untouched
+        products_json = await list_products_use_case.execute_json(limit=limit, offset=offset)
+        return Response(content=products_json, media_type="application/json")
         
     except HTTPException:
         raise
@@ -143,10 +162,12 @@ async def get_product(product_id: UUID) -> ProductResponse:
         404: {"description": "Product not found"},
         422: {"description": "Validation error"},
         500: {"description": "Internal server error"}
-    }
+    },
+    openapi_extra=body_openapi(ProductUpdateRequest)
 )
-async def update_product(product_id: UUID, request: ProductUpdateRequest) -> ProductResponse:
+async def update_product(product_id: UUID, raw_request: Request) -> ProductResponse:
     """Update a product"""
+    request = await parse_body(raw_request, ProductUpdateRequest)
     try:
         product_response = await update_product_use_case.execute(product_id, request)
         return product_response
@@ -3,7 +3,7 @@
 
 from fastapi import FastAPI, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 import uvicorn
 import logging
@@ -57,6 +57,8 @@ async def lifespan(app: FastAPI):
     # Start inventory event consumer
     order_repository = OrderRepository()
     inventory_consumer = InventoryEventConsumer(order_repository)
+    # Health checks inspect this connection instead of opening their own
+    app.state.inventory_consumer = inventory_consumer
     try:
         await inventory_consumer.connect(settings.rabbitmq_url)
         await inventory_consumer.start_consuming()
@@ -79,6 +81,8 @@ app = FastAPI(
     description="High-performance order processing API with event-driven architecture",
     version="1.0.0",
     lifespan=lifespan,
+    # OPTIMIZATION: Route responses are rendered with orjson instead of json.dumps
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -90,6 +94,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Add performance monitoring middleware
@@ -129,5 +134,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8080,
         reload=True,
-        log_level="info"
+        log_level="info",
+        loop="uvloop",  # Mesmo loop do Dockerfile; falha em vez de cair no asyncio padrão
+        http="httptools"
     )
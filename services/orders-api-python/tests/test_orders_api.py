@@ -1,13 +1,16 @@
 # Tests for Orders API
+import asyncio
+import time
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, patch
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 from main import app
-from app.domain.models.order import OrderCreateRequest, OrderResponse, OrderStatus
+from app.domain.models.order import Order, OrderCreateRequest, OrderResponse, OrderStatus
 from app.application.use_cases.order_use_cases import CreateOrderUseCase, GetOrderUseCase
 
 # Test client
@@ -159,7 +162,7 @@ class TestOrderAPI:
             )
         ]
         
-        mock_controller.list_orders_use_case.execute = AsyncMock(return_value=mock_orders)
+        mock_controller.list_orders_use_case.execute = AsyncMock(return_value=(mock_orders, None))
         
         response = client.get("/orders/customer/customer-001")
         assert response.status_code == 200
@@ -171,17 +174,164 @@ class TestOrderAPI:
     
     def test_list_orders_invalid_limit(self):
         """Test listing orders with invalid limit"""
-        response = client.get("/orders/customer/customer-001?limit=0")
-        assert response.status_code == 400
+        response = client.get(f"/orders/customer/{uuid4()}?limit=0")
+        assert response.status_code == 422
         
-        response = client.get("/orders/customer/customer-001?limit=2000")
+        response = client.get(f"/orders/customer/{uuid4()}?limit=2000")
+        assert response.status_code == 422
+    
+    def test_list_orders_invalid_cursor(self):
+        """Test listing orders with a malformed cursor"""
+        response = client.get(f"/orders/customer/{uuid4()}?cursor=not-a-cursor")
         assert response.status_code == 400
     
-    def test_list_orders_invalid_offset(self):
-        """Test listing orders with invalid offset"""
-        response = client.get("/orders/customer/customer-001?offset=-1")
+    def test_list_orders_offset_fallback(self):
+        """Test that the deprecated offset still pages with OFFSET when no cursor is given"""
+        from app.interfaces.api.pagination import NEXT_CURSOR_HEADER
+        from app.interfaces.api.routes import orders
+        
+        customer_id = uuid4()
+        row = {**_order_row(_make_order(customer_id=customer_id)), "total_amount": 10.0}
+        mock_repository = AsyncMock()
+        mock_repository.list_by_customer_raw.return_value = [row]
+        
+        with patch.object(orders.order_controller.list_orders_use_case, "order_repository", mock_repository):
+            response = client.get(f"/orders/customer/{customer_id}?limit=1&offset=10")
+        
+        assert response.status_code == 200
+        assert [o["id"] for o in response.json()] == [str(row["id"])]
+        assert NEXT_CURSOR_HEADER not in response.headers
+        mock_repository.list_by_customer_raw.assert_awaited_once_with(
+            customer_id=customer_id,
+            limit=1,
+            cursor=None,
+            offset=10
+        )
+    
+    def test_cursor_round_trip(self):
+        """Test that keyset cursors survive encoding"""
+        from datetime import datetime, timezone
+        from app.interfaces.api.pagination import encode_cursor, decode_cursor
+        
+        cursor = (datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc), uuid4())
+        assert decode_cursor(encode_cursor(cursor)) == cursor
+
+def _customer_row(created_at: datetime) -> dict:
+    """Database row for a customer"""
+    return {
+        "id": uuid4(),
+        "name": "Customer",
+        "email": f"{uuid4().hex}@example.com",
+        "phone": None,
+        "address": None,
+        "created_at": created_at,
+        "updated_at": created_at
+    }
+
+class TestCustomerPagination:
+    """Test cases for keyset pagination of GET /customers/"""
+    
+    @staticmethod
+    def _mock_repository(rows):
+        mock_repository = AsyncMock()
+        mock_repository.list_page_raw.return_value = rows
+        mock_repository.list_all_raw.return_value = rows
+        return mock_repository
+    
+    def test_full_page_returns_next_cursor_that_round_trips(self):
+        """Test that a full page carries X-Next-Cursor and passing it back resumes after the last row"""
+        from app.interfaces.api.pagination import NEXT_CURSOR_HEADER, decode_cursor
+        from app.interfaces.api.routes import customers
+        
+        rows = [
+            _customer_row(datetime(2024, 1, 2, tzinfo=timezone.utc)),
+            _customer_row(datetime(2024, 1, 1, 12, 30, 0, 250000, tzinfo=timezone.utc))
+        ]
+        mock_repository = self._mock_repository(rows)
+        
+        with patch.object(customers.list_customers_use_case, "customer_repository", mock_repository):
+            response = client.get("/customers/?limit=2")
+            assert response.status_code == 200
+            assert [c["id"] for c in response.json()] == [str(row["id"]) for row in rows]
+            
+            next_cursor = response.headers[NEXT_CURSOR_HEADER]
+            assert decode_cursor(next_cursor) == (rows[-1]["created_at"], rows[-1]["id"])
+            
+            mock_repository.list_page_raw.return_value = []
+            response = client.get("/customers/", params={"limit": 2, "cursor": next_cursor})
+            assert response.status_code == 200
+        
+        mock_repository.list_page_raw.assert_awaited_with(
+            limit=2,
+            cursor=(rows[-1]["created_at"], rows[-1]["id"])
+        )
+    
+    def test_last_page_has_no_next_cursor(self):
+        """Test that a short page omits X-Next-Cursor"""
+        from app.interfaces.api.pagination import NEXT_CURSOR_HEADER
+        from app.interfaces.api.routes import customers
+        
+        mock_repository = self._mock_repository([_customer_row(datetime(2024, 1, 1, tzinfo=timezone.utc))])
+        
+        with patch.object(customers.list_customers_use_case, "customer_repository", mock_repository):
+            response = client.get("/customers/?limit=5")
+        
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert NEXT_CURSOR_HEADER not in response.headers
+    
+    def test_offset_fallback(self):
+        """Test that the deprecated offset still pages with OFFSET when no cursor is given"""
+        from app.interfaces.api.pagination import NEXT_CURSOR_HEADER
+        from app.interfaces.api.routes import customers
+        
+        mock_repository = self._mock_repository([_customer_row(datetime(2024, 1, 1, tzinfo=timezone.utc))])
+        
+        with patch.object(customers.list_customers_use_case, "customer_repository", mock_repository):
+            response = client.get("/customers/?limit=1&offset=10")
+        
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert NEXT_CURSOR_HEADER not in response.headers
+        mock_repository.list_all_raw.assert_awaited_once_with(limit=1, offset=10)
+        mock_repository.list_page_raw.assert_not_awaited()
+    
+    def test_invalid_cursor(self):
+        """Test listing customers with a malformed cursor"""
+        response = client.get("/customers/?cursor=not-a-cursor")
         assert response.status_code == 400
 
+@pytest.fixture(scope="module")
+def db_client():
+    """Client running the app lifespan against a real database; skips when none is reachable"""
+    try:
+        with TestClient(app) as db_client:
+            yield db_client
+    except OSError as e:
+        pytest.skip(f"Database not available: {e}")
+
+class TestProductListIntegration:
+    """Integration tests for product listing (requires PostgreSQL)"""
+    
+    def test_list_body_matches_single_product_body(self, db_client):
+        """Test that the SQL-serialized list renders a product exactly like GET /products/{id}"""
+        created = db_client.post("/products/", json={
+            "name": "Serialization check",
+            "price": 12.5,
+            "sku": f"SER-{uuid4().hex[:12].upper()}",
+            "stock_quantity": 3
+        })
+        assert created.status_code == 201
+        product_id = created.json()["id"]
+        
+        single = db_client.get(f"/products/{product_id}").json()
+        by_ids = db_client.get("/products/", params={"ids": product_id}).json()
+        listed = db_client.get("/products/", params={"limit": 1000}).json()
+        
+        assert [p for p in listed if p["id"] == product_id] == [single]
+        assert by_ids == [single]
+        assert single["created_at"].endswith("Z")
+
 class TestOrderUseCases:
     """Test cases for Order Use Cases"""
     
@@ -233,32 +383,350 @@ class TestOrderUseCases:
         mock_event_publisher.publish_order_created.assert_called_once()
     
     @pytest.mark.asyncio
-    async def test_create_order_use_case_invalid_data(self):
-        """Test order creation with invalid data"""
+    async def test_create_order_stock_out_vs_missing_product(self):
+        """Test that a failed reservation raises InsufficientStockError, or InvalidOrderDataError for an unknown product"""
         from app.domain.models.order import InvalidOrderDataError
+        from app.domain.models.product import InsufficientStockError
         
-        # Mock dependencies
+        mock_order_repository = AsyncMock()
+        mock_order_repository.create_order_atomic.return_value = None
+        mock_product_repository = AsyncMock()
+        use_case = CreateOrderUseCase(mock_order_repository, mock_product_repository)
+        request = OrderCreateRequest(customer_id=uuid4(), product_id=uuid4(), quantity=2, total_amount=99.98)
+        
+        mock_product_repository.exists.return_value = True
+        with pytest.raises(InsufficientStockError):
+            await use_case.execute(request)
+        
+        mock_product_repository.exists.return_value = False
+        with pytest.raises(InvalidOrderDataError):
+            await use_case.execute(request)
+    
+    def test_create_order_request_invalid_data(self):
+        """Test order business rules are enforced by the request model"""
+        from pydantic import ValidationError
+        
+        # Invalid quantity
+        with pytest.raises(ValidationError):
+            OrderCreateRequest(
+                customer_id=uuid4(),
+                product_id=uuid4(),
+                quantity=0,
+                total_amount=99.98
+            )
+        
+        # Amount above the per-order limit
+        with pytest.raises(ValidationError):
+            OrderCreateRequest(
+                customer_id=uuid4(),
+                product_id=uuid4(),
+                quantity=1,
+                total_amount=100000.01
+            )
+
+def _make_order(customer_id=None) -> Order:
+    """Build a pending order for the batching tests"""
+    now = datetime.now(timezone.utc)
+    return Order(
+        id=uuid4(),
+        customer_id=customer_id or uuid4(),
+        product_id=uuid4(),
+        quantity=1,
+        total_amount=10.0,
+        status=OrderStatus.PENDING,
+        created_at=now,
+        updated_at=now
+    )
+
+def _order_row(order: Order) -> dict:
+    """Database row as returned for an inserted order"""
+    return {**order.model_dump(), "status": order.status.value}
+
+class TestOrderCreationBatcher:
+    """Test cases for batched order creation"""
+    
+    @pytest.mark.asyncio
+    async def test_each_caller_gets_its_own_result(self):
+        """Test that the N results of a batch are handed back to the N callers in order"""
+        from app.application.services.order_batcher import OrderCreationBatcher
+        
+        orders = [_make_order() for _ in range(3)]
         mock_repository = AsyncMock()
-        mock_event_publisher = AsyncMock()
+        # The middle order could not reserve stock
+        mock_repository.create_batch_with_outbox.return_value = [orders[0], None, orders[2]]
+        batcher = OrderCreationBatcher(mock_repository, flush_interval_ms=5)
         
-        # Create use case
-        use_case = CreateOrderUseCase(mock_repository, mock_event_publisher)
+        results = await asyncio.gather(*(batcher.submit(order, trace_id=f"t{i}") for i, order in enumerate(orders)))
         
-        # Test data with invalid quantity
-        request = OrderCreateRequest(
-            customer_id="customer-001",
-            product_id="product-001",
-            quantity=0,  # Invalid quantity
-            total_amount=99.98
+        assert results == [orders[0], None, orders[2]]
+        mock_repository.create_batch_with_outbox.assert_awaited_once_with(
+            orders,
+            [("t0", None), ("t1", None), ("t2", None)]
         )
+        mock_repository.create_order_atomic.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_bad_order_fails_only_itself(self):
+        """Test that a batch aborted by one bad customer id is retried order by order"""
+        from app.application.services.order_batcher import OrderCreationBatcher
         
-        # Execute use case and expect exception
-        with pytest.raises(InvalidOrderDataError):
-            await use_case.execute(request)
+        bad_customer = uuid4()
+        good, bad = _make_order(), _make_order(customer_id=bad_customer)
+        
+        async def create_order_atomic(order, **kwargs):
+            if order.customer_id == bad_customer:
+                raise RuntimeError("foreign key violation: customer_id")
+            return order
+        
+        mock_repository = AsyncMock()
+        mock_repository.create_batch_with_outbox.side_effect = RuntimeError("foreign key violation: customer_id")
+        mock_repository.create_order_atomic.side_effect = create_order_atomic
+        batcher = OrderCreationBatcher(mock_repository, flush_interval_ms=5)
+        
+        results = await asyncio.gather(batcher.submit(good), batcher.submit(bad), return_exceptions=True)
+        
+        assert results[0] == good
+        assert isinstance(results[1], RuntimeError)
+        assert mock_repository.create_order_atomic.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_create_batch_with_outbox_maps_rows_to_inputs(self):
+        """Test that saved rows are matched back to their input orders, None where stock was not reserved"""
+        from contextlib import asynccontextmanager
+        from app.infrastructure.database.repositories import OrderRepository
+        
+        orders = [_make_order() for _ in range(3)]
+        conn = MagicMock()
+        conn.executemany = AsyncMock()
+        # Rows come back in arbitrary order and without the order whose reservation failed
+        conn.fetch = AsyncMock(return_value=[_order_row(orders[2]), _order_row(orders[0])])
+        
+        @asynccontextmanager
+        async def transaction():
+            yield
+        
+        @asynccontextmanager
+        async def get_connection():
+            yield conn
+        
+        conn.transaction = transaction
+        with patch('app.infrastructure.database.repositories.db_manager') as mock_db:
+            mock_db.get_connection = get_connection
+            results = await OrderRepository().create_batch_with_outbox(orders, [(None, None)] * 3)
+        
+        assert [result.id if result else None for result in results] == [orders[0].id, None, orders[2].id]
+        args = conn.executemany.await_args.args[1]
+        assert [arg[0] for arg in args] == [order.id for order in orders]
+
+class TestOrderStatusBatcher:
+    """Test cases for batched order status updates"""
+    
+    @pytest.mark.asyncio
+    async def test_result_per_order_from_returning_ids(self):
+        """Test that each caller learns whether its own order was updated"""
+        from app.application.services.order_status_batcher import OrderStatusBatcher
+        
+        found, missing = uuid4(), uuid4()
+        mock_repository = AsyncMock()
+        mock_repository.update_status_many.return_value = {found}
+        batcher = OrderStatusBatcher(mock_repository, flush_interval_ms=5)
+        
+        results = await asyncio.gather(
+            batcher.submit(found, OrderStatus.COMPLETED),
+            batcher.submit(missing, OrderStatus.COMPLETED)
+        )
+        
+        assert results == [True, False]
+        mock_repository.update_status_many.assert_awaited_once_with([found, missing], OrderStatus.COMPLETED)
+    
+    @pytest.mark.asyncio
+    async def test_one_update_per_status(self):
+        """Test that a mixed batch issues one UPDATE per target status"""
+        from app.application.services.order_status_batcher import OrderStatusBatcher
+        
+        completed, failed = uuid4(), uuid4()
+        mock_repository = AsyncMock()
+        mock_repository.update_status_many.side_effect = lambda ids, status: set(ids)
+        batcher = OrderStatusBatcher(mock_repository, flush_interval_ms=5)
+        
+        results = await asyncio.gather(
+            batcher.submit(completed, OrderStatus.COMPLETED),
+            batcher.submit(failed, OrderStatus.FAILED)
+        )
+        
+        assert results == [True, True]
+        assert mock_repository.update_status_many.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_batch_failure_raises_for_every_waiter(self):
+        """Test that a failed UPDATE is raised to every caller of the batch so their messages are nacked"""
+        from app.application.services.order_status_batcher import OrderStatusBatcher
+        
+        mock_repository = AsyncMock()
+        mock_repository.update_status_many.side_effect = RuntimeError("connection lost")
+        batcher = OrderStatusBatcher(mock_repository, flush_interval_ms=5)
+        
+        results = await asyncio.gather(
+            batcher.submit(uuid4(), OrderStatus.COMPLETED),
+            batcher.submit(uuid4(), OrderStatus.COMPLETED),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+    
+    @pytest.mark.asyncio
+    async def test_flush_on_size_limit(self):
+        """Test that a full batch is flushed without waiting for the flush interval"""
+        from app.application.services.order_status_batcher import OrderStatusBatcher
+        
+        mock_repository = AsyncMock()
+        mock_repository.update_status_many.side_effect = lambda ids, status: set(ids)
+        batcher = OrderStatusBatcher(mock_repository, max_batch_size=2, flush_interval_ms=60000)
+        
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                batcher.submit(uuid4(), OrderStatus.COMPLETED),
+                batcher.submit(uuid4(), OrderStatus.COMPLETED)
+            ),
+            timeout=1
+        )
+        
+        assert results == [True, True]
+        mock_repository.update_status_many.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_flush_on_time_limit(self):
+        """Test that a partial batch is flushed once the flush interval elapses"""
+        from app.application.services.order_status_batcher import OrderStatusBatcher
+        
+        mock_repository = AsyncMock()
+        mock_repository.update_status_many.side_effect = lambda ids, status: set(ids)
+        batcher = OrderStatusBatcher(mock_repository, max_batch_size=100, flush_interval_ms=50)
+        
+        started = time.monotonic()
+        assert await asyncio.wait_for(batcher.submit(uuid4(), OrderStatus.FAILED), timeout=1)
+        
+        assert time.monotonic() - started >= 0.04
+        mock_repository.update_status_many.assert_awaited_once()
+
+class TestStructuredFormatter:
+    """Test cases for the structured JSON log formatter"""
+    
+    def test_extras_cannot_clobber_base_fields(self):
+        """Test that extras named like a base field are renamed instead of overwriting or duplicating it"""
+        import json
+        import logging
+        from app.core.config import settings
+        from app.core.logging import StructuredFormatter
+        
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", None, None)
+        record.__dict__.update(service="spoofed", level="DEBUG", timestamp="never", order_id="42")
+        
+        pairs = json.loads(StructuredFormatter().format(record), object_pairs_hook=lambda items: items)
+        keys = [key for key, _ in pairs]
+        data = dict(pairs)
+        
+        assert len(keys) == len(set(keys))
+        assert data["service"] == settings.otel_service_name
+        assert data["level"] == "INFO"
+        assert data["timestamp"].endswith("Z")
+        assert data["extra_service"] == "spoofed"
+        assert data["extra_level"] == "DEBUG"
+        assert data["extra_timestamp"] == "never"
+        assert data["order_id"] == "42"
+
+class TestTTLCache:
+    """Test cases for the in-process TTL/LRU cache"""
+    
+    def test_entry_expires_after_ttl(self):
+        """Test that an entry is served until its TTL elapses and dropped afterwards"""
+        from app.core.cache import TTLCache
+        
+        with patch('app.core.cache.time') as mock_time:
+            mock_time.monotonic.return_value = 100.0
+            cache = TTLCache(maxsize=10, ttl=5.0)
+            cache.set("key", "value")
+            
+            mock_time.monotonic.return_value = 104.9
+            assert cache.get("key") == "value"
+            
+            mock_time.monotonic.return_value = 105.1
+            assert cache.get("key") is None
+            assert len(cache) == 0
+    
+    def test_evicts_least_recently_used_at_maxsize(self):
+        """Test that the least recently used entry is evicted once maxsize is exceeded"""
+        from app.core.cache import TTLCache
+        
+        cache = TTLCache(maxsize=2, ttl=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        # Reading "a" makes "b" the least recently used entry
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+    
+    def test_invalidate_and_clear(self):
+        """Test that invalidate drops one entry and clear drops them all"""
+        from app.core.cache import TTLCache
+        
+        cache = TTLCache(maxsize=10, ttl=60.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        
+        cache.clear()
+        assert len(cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_update_status_many_invalidates_cached_orders(self):
+        """Test that batched status updates evict the orders from the read-through cache"""
+        from app.infrastructure.database import repositories
+        
+        updated, untouched = _make_order(), _make_order()
+        repositories._order_cache.set(updated.id, updated)
+        repositories._order_cache.set(untouched.id, untouched)
+        
+        try:
+            with patch.object(repositories, 'db_manager') as mock_db:
+                mock_db.execute_query = AsyncMock(return_value=[{"id": updated.id}])
+                result = await repositories.OrderRepository().update_status_many([updated.id], OrderStatus.COMPLETED)
+            
+            assert result == {updated.id}
+            assert repositories._order_cache.get(updated.id) is None
+            assert repositories._order_cache.get(untouched.id) == untouched
+        finally:
+            repositories._order_cache.clear()
+
+class TestStatementWarmup:
+    """Test cases for per-connection statement warm-up"""
+    
+    @pytest.mark.asyncio
+    async def test_read_pool_skips_write_warmups(self):
+        """Test that write warm-ups run on main pool connections only"""
+        from app.core.database import DatabaseManager
+        
+        manager = DatabaseManager()
+        manager.register_warmup("SELECT $1::int", 1)
+        manager.register_warmup("UPDATE products SET stock_quantity = stock_quantity WHERE false", write=True)
+        
+        main_conn, read_conn = AsyncMock(), AsyncMock()
+        await manager._init_connection(main_conn)
+        await manager._init_read_connection(read_conn)
         
-        # Verify repository was not called
-        mock_repository.create.assert_not_called()
-        mock_event_publisher.publish_order_created.assert_not_called()
+        main_queries = [call.args[0] for call in main_conn.fetch.await_args_list]
+        read_queries = [call.args[0] for call in read_conn.fetch.await_args_list]
+        assert any(query.startswith("UPDATE") for query in main_queries)
+        assert not any(query.startswith("UPDATE") for query in read_queries)
+        assert "SELECT $1::int" in read_queries
 
 if __name__ == "__main__":
     pytest.main([__file__])